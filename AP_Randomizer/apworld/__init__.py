@@ -1,15 +1,32 @@
+import importlib
 from worlds.AutoWorld import World
-from BaseClasses import Region
-from .items import PseudoregaliaItem, item_table, item_frequencies, item_groups
+from BaseClasses import Region, Entrance, CollectionState, Item, ItemClassification
+from .items import PseudoregaliaItem, item_table, item_groups
 from .locations import PseudoregaliaLocation, location_table
-from .regions import region_table
-from .options import PseudoregaliaOptions
-from .rules_normal import PseudoregaliaNormalRules
-from .rules_hard import PseudoregaliaHardRules
-from .rules_expert import PseudoregaliaExpertRules
-from .rules_lunatic import PseudoregaliaLunaticRules
-from typing import Dict, Any
+from .options import PseudoregaliaOptions, EarlyEnabler
+from .rules import PseudoregaliaRulesHelpers, update_capabilities
+from .reachability import get_table, get_early_enablers
+from .playthrough import SlotPlaythrough, calculate_playthrough
+from .templates import get_template
+from .export import get_logic_fingerprint
+from typing import Dict, Any, List, TextIO, Tuple, Type
 from .constants.difficulties import NORMAL, HARD, EXPERT, LUNATIC
+from .constants.capabilities import CAPABILITIES
+
+
+# Module and class of the rules for each logic level. Each difficulty's module is only imported once a player
+# uses it, importing a harder difficulty also imports the easier ones it builds on.
+rules_classes: Dict[int, Tuple[str, str]] = {
+    NORMAL: ("rules_normal", "PseudoregaliaNormalRules"),
+    HARD: ("rules_hard", "PseudoregaliaHardRules"),
+    EXPERT: ("rules_expert", "PseudoregaliaExpertRules"),
+    LUNATIC: ("rules_lunatic", "PseudoregaliaLunaticRules"),
+}
+
+
+def get_rules_class(logic_level: int) -> Type[PseudoregaliaRulesHelpers]:
+    module_name, class_name = rules_classes[logic_level]
+    return getattr(importlib.import_module(f".{module_name}", __name__), class_name)
 
 
 class PseudoregaliaWorld(World):
@@ -24,58 +41,77 @@ class PseudoregaliaWorld(World):
     options_dataclass = PseudoregaliaOptions
     options: PseudoregaliaOptions
 
+    # Handles to the world's regions, entrances and locations by name. Set in create_regions.
+    regions_by_name: Dict[str, Region]
+    entrances_by_name: Dict[str, Entrance]
+    locations_by_name: Dict[str, PseudoregaliaLocation]
+
+    # Maps each item that can change the capability vector to the entrances and locations depending on it.
+    # Set in set_rules.
+    rule_dependencies: Dict[str, Tuple[str, ...]]
+    # The rules class for the player's logic level. Set in generate_early.
+    rules_class: Type[PseudoregaliaRulesHelpers]
+
     def create_item(self, name: str) -> PseudoregaliaItem:
         data = item_table[name]
         return PseudoregaliaItem(name, data.classification, data.code, self.player)
 
     def create_items(self):
-        for item_name, item_data in item_table.items():
-            if (item_name == "Dream Breaker"):
-                continue  # Really skrunkled way of just adding the one locked breaker to the pool for now.
-            if (item_data.code and item_data.can_create(self)):
-                item_count = 1
-                if (item_name in item_frequencies):
-                    item_count = item_frequencies[item_name]
-                for count in range(item_count):
-                    self.multiworld.itempool.append(
-                        PseudoregaliaItem(item_name, item_data.classification, item_data.code, self.player))
+        for item_name, item_count in get_template(self).item_counts.items():
+            for count in range(item_count):
+                self.multiworld.itempool.append(self.create_item(item_name))
 
     def generate_early(self):
         if self.options.logic_level in (EXPERT, LUNATIC):
             # obscure is forced on for expert/lunatic difficulties
             self.options.obscure_logic.value = 1
+        self.rules_class = get_rules_class(self.options.logic_level.value)
 
     def create_regions(self):
-        for region_name in region_table.keys():
-            self.multiworld.regions.append(Region(region_name, self.player, self.multiworld))
+        region_exits = self.rules_class.get_region_exits(self)
+        regions = self.regions_by_name = {
+            region_name: Region(region_name, self.player, self.multiworld) for region_name in region_exits}
+        self.multiworld.regions.extend(regions.values())
 
-        for loc_name, loc_data in location_table.items():
-            if not loc_data.can_create(self):
-                continue
-            region = self.multiworld.get_region(loc_data.region, self.player)
-            new_loc = PseudoregaliaLocation(self.player, loc_name, loc_data.code, region)
-            if (not loc_data.show_in_spoiler):
-                new_loc.show_in_spoiler = False
-            region.locations.append(new_loc)
+        template = get_template(self)
+        self.locations_by_name = {}
+        for region_name, location_names in template.region_locations.items():
+            region = regions[region_name]
+            new_locations = []
+            for loc_name in location_names:
+                loc_data = location_table[loc_name]
+                new_loc = PseudoregaliaLocation(self.player, loc_name, loc_data.code, region)
+                if (not loc_data.show_in_spoiler):
+                    new_loc.show_in_spoiler = False
+                new_locations.append(new_loc)
+                self.locations_by_name[loc_name] = new_loc
+            region.locations.extend(new_locations)
 
-        for region_name, exit_list in region_table.items():
-            region = self.multiworld.get_region(region_name, self.player)
-            region.add_exits(exit_list)
+        self.entrances_by_name = {}
+        for region_name, exits in region_exits.items():
+            region = regions[region_name]
+            for exit_name in exits:
+                entrance = region.connect(regions[exit_name])
+                self.entrances_by_name[entrance.name] = entrance
 
         # Place locked locations.
-        for location_name, location_data in self.locked_locations.items():
-            if not location_data.can_create(self):
-                continue
+        for location_name, item_name in template.locked_items.items():
+            self.locations_by_name[location_name].place_locked_item(self.create_item(item_name))
 
-            # Doing this really stupidly because breaker's locking will change after logic rework is done
-            if location_name == "Dilapidated Dungeon - Dream Breaker":
-                if bool(self.options.progressive_breaker):
-                    locked_item = self.create_item("Progressive Dream Breaker")
-                    self.multiworld.get_location(location_name, self.player).place_locked_item(locked_item)
-                    continue
-
-            locked_item = self.create_item(location_table[location_name].locked_item)
-            self.multiworld.get_location(location_name, self.player).place_locked_item(locked_item)
+    def pre_fill(self):
+        early_enabler = self.options.early_enabler
+        if early_enabler == EarlyEnabler.option_off:
+            return
+        enablers = get_early_enablers(self)
+        if not enablers:
+            return
+        if early_enabler == EarlyEnabler.option_local:
+            early_items = self.multiworld.local_early_items
+        else:
+            early_items = self.multiworld.early_items
+        # Keep a higher count the player asked for themselves.
+        choice = self.random.choice(enablers)
+        early_items[self.player][choice] = max(early_items[self.player].get(choice, 0), 1)
 
     def fill_slot_data(self) -> Dict[str, Any]:
         return {"slot_number": self.player,
@@ -84,15 +120,55 @@ class PseudoregaliaWorld(World):
                 "obscure_logic": bool(self.options.obscure_logic),
                 "progressive_breaker": bool(self.options.progressive_breaker),
                 "progressive_slide": bool(self.options.progressive_slide),
-                "split_sun_greaves": bool(self.options.split_sun_greaves), }
+                "split_sun_greaves": bool(self.options.split_sun_greaves),
+                "logic_fingerprint": get_logic_fingerprint(self), }
+
+    def write_spoiler(self, spoiler_handle: TextIO) -> None:
+        playthrough = self.get_playthrough()
+        if not playthrough.complete:
+            return  # Some of the player's progression is in other worlds, the main playthrough covers it.
+        spoiler_handle.write(f"\n\nPseudoregalia spheres ({self.multiworld.get_player_name(self.player)}):\n")
+        for number, sphere in enumerate(playthrough.spheres, 1):
+            found = [f"{name}: {self.locations_by_name[name].item.name}" for name in sphere
+                     if self.locations_by_name[name].advancement]
+            if found:
+                spoiler_handle.write(f"  {number}: {', '.join(found)}\n")
+        spoiler_handle.write(f"Required: {', '.join(playthrough.required)}\n")
+
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        change = super().collect(state, item)
+        if change:
+            update_capabilities(state.prog_items[self.player], item.name)
+        return change
+
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        change = super().remove(state, item)
+        if change:
+            update_capabilities(state.prog_items[self.player], item.name)
+        return change
+
+    def get_reachable(self, state: CollectionState) -> Tuple[int, int]:
+        """Returns bitsets of the regions and locations reachable with the player's items in state,
+        see region_bits and location_bits in reachability.py. Only valid after set_rules."""
+        return get_table(self)[state.prog_items[self.player][CAPABILITIES]]
+
+    def get_playthrough(self) -> SlotPlaythrough:
+        """Returns the spheres of the player's own world and the progression required to beat it,
+        see playthrough.py. Only valid after fill."""
+        return calculate_playthrough(self)
+
+    def get_inert_items(self) -> List[str]:
+        """Returns the progression items in the player's pool that no entrance or location depends on
+        with the player's options, besides the completion item. Only valid after set_rules."""
+        inert = []
+        for name, data in item_table.items():
+            if data.code is None or not data.can_create(self):
+                continue
+            if data.classification & ItemClassification.progression and not self.rule_dependencies.get(name):
+                inert.append(name)
+        return inert
 
     def set_rules(self):
-        difficulty = self.options.logic_level
-        if difficulty == NORMAL:
-            PseudoregaliaNormalRules(self).set_pseudoregalia_rules()
-        elif difficulty == HARD:
-            PseudoregaliaHardRules(self).set_pseudoregalia_rules()
-        elif difficulty == EXPERT:
-            PseudoregaliaExpertRules(self).set_pseudoregalia_rules()
-        elif difficulty == LUNATIC:
-            PseudoregaliaLunaticRules(self).set_pseudoregalia_rules()
+        rules = self.rules_class
+        rules.set_pseudoregalia_rules(self)
+        self.rule_dependencies = rules.get_shared_rule_dependencies(self)
@@ -0,0 +1,53 @@
+from typing import Dict, List, Optional, Set
+from .logic import Requirements, TRUE
+
+# Entrances into a region that's reached for free anyway are wasted work for every sweep. Condensing the region
+# graph drops an entrance without rules when its target stays reachable from its source through the remaining
+# entrances without rules, and an entrance with rules when its target is reachable from its source without any.
+# Which regions reach which for free never changes, and every remaining entrance keeps its real source, target
+# and name, so spoiler paths only show real transitions.
+condense_regions = True
+
+# The exits of every region and the requirements of each.
+RegionExits = Dict[str, Dict[str, Requirements]]
+
+
+def get_free_reachable(exits: RegionExits, region: str, skip: Optional[str] = None) -> Set[str]:
+    """Returns the regions reachable from region through exits without rules, including itself,
+    without using the exit from region to skip."""
+    always = TRUE.requirements()
+    seen = {region}
+    queue = [region]
+    while queue:
+        source = queue.pop()
+        for exit, requirements in exits[source].items():
+            if requirements == always and exit not in seen and not (source == region and exit == skip):
+                seen.add(exit)
+                queue.append(exit)
+    return seen
+
+
+def condense(region_table: Dict[str, List[str]], region_requirements: Dict[str, Requirements]) -> RegionExits:
+    """Returns region_table's exits with their requirements, leaving out the redundant ones, see above."""
+    always = TRUE.requirements()
+    exits = uncondensed(region_table, region_requirements)
+
+    # Exits without rules are tried last to first in region_table order, so earlier ones are kept.
+    for region in reversed(region_table):
+        for exit in reversed(region_table[region]):
+            if exits[region][exit] == always and exit in get_free_reachable(exits, region, exit):
+                del exits[region][exit]
+
+    for region, region_exits in exits.items():
+        free_reachable = get_free_reachable(exits, region)
+        for exit in [exit for exit, requirements in region_exits.items() if requirements != always]:
+            if exit in free_reachable:
+                del region_exits[exit]
+    return exits
+
+
+def uncondensed(region_table: Dict[str, List[str]], region_requirements: Dict[str, Requirements]) -> RegionExits:
+    """Returns region_table's exits as they are, with their requirements."""
+    always = TRUE.requirements()
+    return {region: {exit: region_requirements.get(f"{region} -> {exit}", always) for exit in exits}
+            for region, exits in region_table.items()}
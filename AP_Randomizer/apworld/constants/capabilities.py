@@ -0,0 +1,28 @@
+# Bits of the capability vector that rules are tested against, see get_capabilities in rules.py.
+# Leveled capabilities are cumulative, e.g. SOUL_CUTTER is only set alongside BREAKER and STRIKEBREAK.
+BREAKER = 1 << 0
+STRIKEBREAK = 1 << 1
+SOUL_CUTTER = 1 << 2
+SLIDE = 1 << 3
+SLIDEJUMP = 1 << 4
+PLUNGE = 1 << 5
+GEM = 1 << 6
+LIGHT = 1 << 7
+KICKS_1 = 1 << 8
+KICKS_2 = 1 << 9
+KICKS_3 = 1 << 10
+KICKS_4 = 1 << 11
+SMALL_KEYS_6 = 1 << 12
+SMALL_KEYS_7 = 1 << 13
+MAJOR_KEYS = 1 << 14
+
+BOUNCE = BREAKER | LIGHT
+
+# Indexed by level or count.
+BREAKER_LEVELS = (0, BREAKER, BREAKER | STRIKEBREAK, BREAKER | STRIKEBREAK | SOUL_CUTTER)
+SLIDE_LEVELS = (0, SLIDE, SLIDE | SLIDEJUMP)
+KICKS = (0, KICKS_1, KICKS_1 | KICKS_2, KICKS_1 | KICKS_2 | KICKS_3, KICKS_1 | KICKS_2 | KICKS_3 | KICKS_4)
+SMALL_KEYS = {6: SMALL_KEYS_6, 7: SMALL_KEYS_6 | SMALL_KEYS_7}
+
+# Not a real item, the capability vector is stored in state.prog_items under this name.
+CAPABILITIES = "Pseudoregalia Capabilities"
@@ -0,0 +1,100 @@
+import hashlib
+import itertools
+import json
+from collections import Counter
+from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
+from .items import item_table, item_frequencies
+from .locations import location_table
+from .rules import item_capabilities
+from .templates import get_template_key
+from .constants import capabilities
+
+if TYPE_CHECKING:
+    from . import PseudoregaliaWorld
+
+# Compiled logic in a form trackers and clients can evaluate without the apworld:
+#   capabilities: the bit of the capability vector for each capability name.
+#   capability_items: for each capability, the minimal sets of item counts that grant it, any one of which will do.
+#   items: the id of every item.
+#   regions: the exits of every region as created, condensed by default (see condensation.py), sorted by name.
+#   Entrances are named "<region> -> <exit>".
+#   entrances and locations: the requirements of every rule, a list of capability masks any one of which
+#   satisfies it, [] is never satisfied. Entrances without rules are left out, locations list every location
+#   created for the options with its id (null for events) and region.
+# Bump export_version whenever the format changes.
+export_version = 1
+
+capability_names: Tuple[Tuple[str, int], ...] = (
+    ("breaker", capabilities.BREAKER),
+    ("strikebreak", capabilities.STRIKEBREAK),
+    ("soul_cutter", capabilities.SOUL_CUTTER),
+    ("slide", capabilities.SLIDE),
+    ("slidejump", capabilities.SLIDEJUMP),
+    ("plunge", capabilities.PLUNGE),
+    ("gem", capabilities.GEM),
+    ("light", capabilities.LIGHT),
+    ("kicks_1", capabilities.KICKS_1),
+    ("kicks_2", capabilities.KICKS_2),
+    ("kicks_3", capabilities.KICKS_3),
+    ("kicks_4", capabilities.KICKS_4),
+    ("small_keys_6", capabilities.SMALL_KEYS_6),
+    ("small_keys_7", capabilities.SMALL_KEYS_7),
+    ("major_keys", capabilities.MAJOR_KEYS),
+)
+
+_fingerprints: Dict[Tuple, str] = {}
+
+
+def get_capability_items() -> Dict[str, List[Dict[str, int]]]:
+    """Enumerates the items feeding each getter in rules.item_capabilities up to one more than the pool holds,
+    keeping the smallest item counts that grant each capability."""
+    families: Dict[Callable[[Counter], int], List[str]] = {}
+    for name, (_, get_bits) in item_capabilities.items():
+        families.setdefault(get_bits, []).append(name)
+
+    capability_items: Dict[str, List[Dict[str, int]]] = {name: [] for name, _ in capability_names}
+    for get_bits, names in families.items():
+        ranges = [range(item_frequencies.get(name, 1) + 2) for name in names]
+        for counts in sorted(itertools.product(*ranges), key=sum):
+            granted = get_bits(Counter(dict(zip(names, counts))))
+            for capability, bit in capability_names:
+                if not granted & bit:
+                    continue
+                grant = {name: count for name, count in zip(names, counts) if count}
+                minimal = capability_items[capability]
+                if not any(all(grant.get(name, 0) >= count for name, count in other.items()) for other in minimal):
+                    minimal.append(grant)
+    return capability_items
+
+
+def export_logic(world: "PseudoregaliaWorld") -> Dict[str, Any]:
+    """Returns the world's compiled logic, see the description of the format above. Only valid after set_rules."""
+    region_requirements, location_requirements = world.rules_class.get_installed_requirement_tables(world)
+    return {
+        "version": export_version,
+        "capabilities": dict(capability_names),
+        "capability_items": get_capability_items(),
+        "items": {name: data.code for name, data in item_table.items() if data.code is not None},
+        "regions": {region: sorted(exits) for region, exits in world.rules_class.get_region_exits(world).items()},
+        "entrances": {name: sorted(requirements) for name, requirements in region_requirements.items()},
+        "locations": {
+            name: {"id": location_table[name].code,
+                   "region": location_table[name].region,
+                   "requirements": sorted(location_requirements.get(name, (0,)))}
+            for name in world.locations_by_name},
+    }
+
+
+def dump_logic(logic: Dict[str, Any]) -> str:
+    """Serializes exported logic compactly and deterministically, so equal logic always dumps the same."""
+    return json.dumps(logic, sort_keys=True, separators=(",", ":"))
+
+
+def get_logic_fingerprint(world: "PseudoregaliaWorld") -> str:
+    """Returns the sha256 of the world's dumped logic, computed once per combination of options.
+    Lets trackers detect when the logic they have doesn't match the one a seed was generated with."""
+    key = (world.rules_class, bool(world.options.obscure_logic), get_template_key(world))
+    fingerprint = _fingerprints.get(key)
+    if fingerprint is None:
+        fingerprint = _fingerprints[key] = hashlib.sha256(dump_logic(export_logic(world)).encode()).hexdigest()
+    return fingerprint
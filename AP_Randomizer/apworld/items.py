@@ -1,47 +1,46 @@
 from BaseClasses import Item, ItemClassification
-from typing import NamedTuple, Dict, Set, Callable, TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from . import PseudoregaliaWorld
+from .world_data import OptionsPredicate, get_options_predicate
+from typing import NamedTuple, Dict, Set
 
 
 class PseudoregaliaItem(Item):
+    __slots__ = ()
     game = "Pseudoregalia"
 
 
 class PseudoregaliaItemData(NamedTuple):
     code: int = None
     classification: ItemClassification = ItemClassification.filler
-    can_create: "Callable[[PseudoregaliaWorld, int], bool]" = lambda world: True
+    can_create: OptionsPredicate = get_options_predicate({})
 
 
 item_table: Dict[str, PseudoregaliaItemData] = {
     "Dream Breaker": PseudoregaliaItemData(
         code=2365810001,
         classification=ItemClassification.progression,
-        can_create=lambda world: not bool(world.options.progressive_breaker)),
+        can_create=get_options_predicate({"progressive_breaker": False})),
     "Indignation": PseudoregaliaItemData(
         code=2365810002,
         classification=ItemClassification.useful),
     "Sun Greaves": PseudoregaliaItemData(
         code=2365810003,
         classification=ItemClassification.progression,
-        can_create=lambda world: not bool(world.options.split_sun_greaves)),
+        can_create=get_options_predicate({"split_sun_greaves": False})),
     "Slide": PseudoregaliaItemData(
         code=2365810004,
         classification=ItemClassification.progression,
-        can_create=lambda world: not bool(world.options.progressive_slide)),
+        can_create=get_options_predicate({"progressive_slide": False})),
     "Solar Wind": PseudoregaliaItemData(
         code=2365810005,
         classification=ItemClassification.progression,
-        can_create=lambda world: not bool(world.options.progressive_slide)),
+        can_create=get_options_predicate({"progressive_slide": False})),
     "Sunsetter": PseudoregaliaItemData(
         code=2365810006,
         classification=ItemClassification.progression),
     "Strikebreak": PseudoregaliaItemData(
         code=2365810007,
         classification=ItemClassification.progression,
-        can_create=lambda world: not bool(world.options.progressive_breaker)),
+        can_create=get_options_predicate({"progressive_breaker": False})),
     "Cling Gem": PseudoregaliaItemData(
         code=2365810008,
         classification=ItemClassification.progression),
@@ -51,12 +50,12 @@ item_table: Dict[str, PseudoregaliaItemData] = {
     "Soul Cutter": PseudoregaliaItemData(
         code=2365810010,
         classification=ItemClassification.progression,
-        can_create=lambda world: not bool(world.options.progressive_breaker)),
+        can_create=get_options_predicate({"progressive_breaker": False})),
 
     "Heliacal Power": PseudoregaliaItemData(
         code=2365810011,
         classification=ItemClassification.progression,
-        can_create=lambda world: not bool(world.options.split_sun_greaves)),
+        can_create=get_options_predicate({"split_sun_greaves": False})),
     "Aerial Finesse": PseudoregaliaItemData(
         code=2365810012,
         classification=ItemClassification.filler),
@@ -105,15 +104,15 @@ item_table: Dict[str, PseudoregaliaItemData] = {
     "Progressive Slide": PseudoregaliaItemData(
         code=2365810026,
         classification=ItemClassification.progression,
-        can_create=lambda world: bool(world.options.progressive_slide)),
+        can_create=get_options_predicate({"progressive_slide": True})),
     "Air Kick": PseudoregaliaItemData(
         code=2365810027,
         classification=ItemClassification.progression,
-        can_create=lambda world: bool(world.options.split_sun_greaves)),
+        can_create=get_options_predicate({"split_sun_greaves": True})),
     "Progressive Dream Breaker": PseudoregaliaItemData(
         code=2365810028,
         classification=ItemClassification.progression,
-        can_create=lambda world: bool(world.options.progressive_breaker)),
+        can_create=get_options_predicate({"progressive_breaker": True})),
 
     "Unlocked Door": PseudoregaliaItemData(
         classification=ItemClassification.useful),
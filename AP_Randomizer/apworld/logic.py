@@ -0,0 +1,252 @@
+from typing import Dict, Iterable, NamedTuple, Tuple
+from .constants.capabilities import (BREAKER, SLIDE, PLUNGE, GEM, LIGHT, MAJOR_KEYS, BOUNCE, BREAKER_LEVELS,
+                                     SLIDE_LEVELS, KICKS, SMALL_KEYS)
+
+# Rules are written as expression trees over the capability vector, combined with & and |.
+# Trees are resolved against a player's options and then reduced to their minimal requirements.
+
+# Alternative sets of capability bits, any one of which satisfies a rule. () is never satisfied, (0,) always is.
+# Capability bits are cumulative (see constants/capabilities.py), so a set of bits that contains another set
+# is strictly harder to satisfy and never needs to be listed.
+Requirements = Tuple[int, ...]
+
+
+class LogicContext(NamedTuple):
+    """The options rules are resolved against."""
+    obscure: bool
+    required_small_keys: int
+
+
+class Rule:
+    """A node of a rule expression tree.
+    Nodes are hash-consed: building a node equal to an existing one returns the existing object,
+    so equal subexpressions are shared between rules and difficulties and compare by identity."""
+    __slots__ = ("args",)
+    args: Tuple
+
+    _nodes: Dict[Tuple, "Rule"] = {}
+
+    def __new__(cls, *args):
+        key = (cls, *args)
+        node = Rule._nodes.get(key)
+        if node is None:
+            node = super().__new__(cls)
+            node.args = args
+            Rule._nodes[key] = node
+        return node
+
+    def __reduce__(self):
+        return type(self), self.args
+
+    def __and__(self, other: "Rule") -> "Rule":
+        return And(self, other)
+
+    def __or__(self, other: "Rule") -> "Rule":
+        return Or(self, other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(repr, self.args))})"
+
+    def resolve(self, context: LogicContext) -> "Rule":
+        """Returns an equivalent tree containing only Has, And and Or nodes for the given options."""
+        return self
+
+    def requirements(self) -> Requirements:
+        """Returns the minimal requirements of this resolved tree."""
+        requirements = _requirements.get(self)
+        if requirements is None:
+            requirements = _requirements[self] = self._requirements()
+        return requirements
+
+    def _requirements(self) -> Requirements:
+        raise TypeError(f"{self!r} must be resolved before it can be reduced")
+
+
+_requirements: Dict[Rule, Requirements] = {}
+
+
+def minimize(alternatives: Iterable[int]) -> Requirements:
+    """Drops alternatives that are dominated by another one, and orders the rest from fewest bits to most."""
+    minimal = []
+    ordered = sorted(set(alternatives), key=lambda capabilities: (bin(capabilities).count("1"), capabilities))
+    for capabilities in ordered:
+        if not any(capabilities & other == other for other in minimal):
+            minimal.append(capabilities)
+    return tuple(minimal)
+
+
+class Has(Rule):
+    """Requires every bit in capabilities, see constants/capabilities.py."""
+    __slots__ = ()
+
+    def _requirements(self) -> Requirements:
+        return self.args
+
+
+class Kicks(Rule):
+    """Requires at least count air kicks from Sun Greaves, Heliacal Power or Air Kicks."""
+    __slots__ = ()
+
+    def resolve(self, context: LogicContext) -> Rule:
+        count = self.args[0]
+        return Has(KICKS[count]) if count else TRUE
+
+
+class KickOrPlunge(Rule):
+    """Used where one air kick can be replaced with sunsetter.
+    Input is the number of kicks needed without plunge."""
+    __slots__ = ()
+
+    def resolve(self, context: LogicContext) -> Rule:
+        count = self.args[0]
+        return (Kicks(count) | Plunge & Kicks(count - 1)).resolve(context)
+
+
+class KnowsObscure(Rule):
+    """True when Obscure Logic is enabled, False when it isn't."""
+    __slots__ = ()
+
+    def resolve(self, context: LogicContext) -> Rule:
+        return TRUE if context.obscure else FALSE
+
+
+class HasSmallKeys(Rule):
+    """Requires a way to open doors and enough small keys to open all of them for the logic level."""
+    __slots__ = ()
+
+    def resolve(self, context: LogicContext) -> Rule:
+        return (Attack & Has(SMALL_KEYS[context.required_small_keys])).resolve(context)
+
+
+class And(Rule):
+    __slots__ = ()
+
+    def __new__(cls, *children: Rule):
+        flat = []
+        for child in children:
+            for grandchild in child.args if type(child) is And else (child,):
+                if grandchild not in flat:
+                    flat.append(grandchild)
+        if len(flat) == 1:
+            return flat[0]
+        return super().__new__(cls, *flat)
+
+    def __repr__(self) -> str:
+        return "TRUE" if self is TRUE else f"({' & '.join(map(repr, self.args))})"
+
+    def resolve(self, context: LogicContext) -> Rule:
+        children = []
+        merged = None
+        capabilities = 0
+        for child in self.args:
+            child = child.resolve(context)
+            for grandchild in child.args if type(child) is And else (child,):
+                if grandchild is FALSE:
+                    return FALSE
+                if type(grandchild) is Has:
+                    # Requirements on the vector merge into a single test, placed where the first one was.
+                    if merged is None:
+                        merged = len(children)
+                        children.append(grandchild)
+                    capabilities |= grandchild.args[0]
+                else:
+                    children.append(grandchild)
+        if merged is not None:
+            children[merged] = Has(capabilities)
+        return And(*children)
+
+    def _requirements(self) -> Requirements:
+        requirements = (0,)
+        for child in self.args:
+            requirements = minimize(capabilities | other
+                                    for capabilities in requirements for other in child.requirements())
+        return requirements
+
+
+class Or(Rule):
+    __slots__ = ()
+
+    def __new__(cls, *children: Rule):
+        flat = []
+        for child in children:
+            for grandchild in child.args if type(child) is Or else (child,):
+                if grandchild not in flat:
+                    flat.append(grandchild)
+        if len(flat) == 1:
+            return flat[0]
+        return super().__new__(cls, *flat)
+
+    def __repr__(self) -> str:
+        return "FALSE" if self is FALSE else f"({' | '.join(map(repr, self.args))})"
+
+    def resolve(self, context: LogicContext) -> Rule:
+        children = []
+        for child in self.args:
+            child = child.resolve(context)
+            if child is TRUE:
+                return TRUE
+            if child is not FALSE:
+                children.append(child)
+        return Or(*children)
+
+    def _requirements(self) -> Requirements:
+        return minimize(capabilities for child in self.args for capabilities in child.requirements())
+
+
+TRUE = And()
+FALSE = Or()
+
+Breaker = Has(BREAKER)
+Strikebreak = Has(BREAKER_LEVELS[2])
+SoulCutter = Has(BREAKER_LEVELS[3])
+Slide = Has(SLIDE)
+SlideJump = Has(SLIDE_LEVELS[2])
+Plunge = Has(PLUNGE)
+Gem = Has(GEM)
+Light = Has(LIGHT)
+Bounce = Has(BOUNCE)
+MajorKeys = Has(MAJOR_KEYS)
+Obscure = KnowsObscure()
+SmallKeys = HasSmallKeys()
+
+# Used where either breaker or sunsetter will work, for example on switches.
+# Using sunsetter is considered Obscure Logic.
+Attack = Breaker | Obscure & Plunge
+# TODO: Update this to check obscure tricks for breaker only when logic rework nears completion
+NavigateDarkrooms = Breaker | Light
+
+
+# Longest first, so leveled capabilities are described by their highest level.
+_capability_names = (
+    (BREAKER_LEVELS[3], "SoulCutter"),
+    (BREAKER_LEVELS[2], "Strikebreak"),
+    (BOUNCE, "Bounce"),
+    (BREAKER, "Breaker"),
+    (SLIDE_LEVELS[2], "SlideJump"),
+    (SLIDE, "Slide"),
+    (PLUNGE, "Plunge"),
+    (GEM, "Gem"),
+    (LIGHT, "Light"),
+    (KICKS[4], "Kicks(4)"),
+    (KICKS[3], "Kicks(3)"),
+    (KICKS[2], "Kicks(2)"),
+    (KICKS[1], "Kicks(1)"),
+    (SMALL_KEYS[7], "SmallKeys(7)"),
+    (SMALL_KEYS[6], "SmallKeys(6)"),
+    (MAJOR_KEYS, "MajorKeys"),
+)
+
+
+def describe(requirements: Requirements) -> str:
+    """Formats requirements the way clauses are written, e.g. "Gem | Kicks(1) | Plunge"."""
+    if not requirements:
+        return "FALSE"
+    alternatives = []
+    for capabilities in requirements:
+        names = []
+        for bits, name in _capability_names:
+            if capabilities & bits == bits:
+                names.append(name)
+                capabilities &= ~bits
+        alternatives.append(" & ".join(names) or "TRUE")
+    return " | ".join(alternatives)
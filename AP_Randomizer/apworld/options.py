@@ -63,6 +63,22 @@ class SplitSunGreaves(Toggle):
     display_name = "Split Sun Greaves"
 
 
+class EarlyEnabler(Choice):
+    """
+    Places one movement item that opens up several new locations, like Slide, Sunsetter or Cling Gem,
+    in the first sphere, so there are more locations open early on.
+
+    Off: No item is placed early.
+    Local: The item is placed in one of your own first sphere locations.
+    Early: The item is placed in the first sphere of any world.
+    """
+    display_name = "Early Enabler"
+    option_off = 0
+    option_local = 1
+    option_early = 2
+    default = 0
+
+
 @dataclass
 class PseudoregaliaOptions(PerGameCommonOptions):
     logic_level: LogicLevel
@@ -70,5 +86,6 @@ class PseudoregaliaOptions(PerGameCommonOptions):
     progressive_breaker: ProgressiveBreaker
     progressive_slide: ProgressiveSlide
     split_sun_greaves: SplitSunGreaves
+    early_enabler: EarlyEnabler
     death_link: DeathLink
 
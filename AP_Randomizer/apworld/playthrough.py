@@ -0,0 +1,80 @@
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+from .reachability import get_table, location_bits
+from .rules import get_capabilities
+
+if TYPE_CHECKING:
+    from BaseClasses import Location
+    from . import PseudoregaliaWorld
+
+completion_item = "Something Worth Being Awake For"
+
+
+class SlotPlaythrough(NamedTuple):
+    """The spheres of one player's own world, computed from the reachability table instead of sweeping."""
+    # Names of the locations that become reachable in each sphere, in location_table order.
+    spheres: Tuple[Tuple[str, ...], ...]
+    # Whether the completion item is reached.
+    beatable: bool
+    # Names of the locations holding progression the completion item can't be reached without, in sphere order.
+    required: Tuple[str, ...]
+    # Whether every progression item of the player is precollected or placed in the player's own world.
+    # Otherwise items found in other worlds are missing and the spheres only cover what the world reaches alone.
+    complete: bool
+
+
+def sweep_spheres(world: "PseudoregaliaWorld", skip: Optional[str] = None,
+                  locations: Optional[Dict[int, "Location"]] = None) -> Tuple[List[Tuple[str, ...]], bool]:
+    """Collects the player's progression sphere by sphere, leaving out the item at location skip.
+    locations maps location bits to the world's locations, see get_locations_by_bit."""
+    player = world.player
+    table = get_table(world)
+    if locations is None:
+        locations = get_locations_by_bit(world)
+    items = Counter(item.name for item in world.multiworld.precollected_items[player] if item.advancement)
+    checked = 0
+    spheres = []
+    while True:
+        new = table[get_capabilities(items)][1] & ~checked
+        if not new:
+            break
+        checked |= new
+        sphere = []
+        while new:
+            bit = new & -new
+            new ^= bit
+            location = locations[bit]
+            sphere.append(location.name)
+            item = location.item
+            if item is not None and item.player == player and item.advancement and location.name != skip:
+                items[item.name] += 1
+        spheres.append(tuple(sphere))
+    return spheres, items[completion_item] > 0
+
+
+def get_locations_by_bit(world: "PseudoregaliaWorld") -> Dict[int, "Location"]:
+    return {location_bits[location.name]: location for location in world.locations_by_name.values()
+            if location.name in location_bits}
+
+
+def calculate_playthrough(world: "PseudoregaliaWorld") -> SlotPlaythrough:
+    """Returns the spheres of the player's own world and the progression required to beat it.
+    Every progression item is tried without by sweeping again, which the table makes cheap. Only valid after fill."""
+    player = world.player
+    locations = get_locations_by_bit(world)
+    spheres, beatable = sweep_spheres(world, locations=locations)
+    required = []
+    if beatable:
+        for sphere in spheres:
+            for name in sphere:
+                item = world.locations_by_name[name].item
+                if item is None or item.player != player or not item.advancement or item.name == completion_item:
+                    continue
+                if not sweep_spheres(world, name, locations)[1]:
+                    required.append(name)
+
+    progression = sum(1 for location in world.multiworld.get_filled_locations()
+                      if location.item.player == player and location.item.advancement)
+    local = sum(1 for location in world.locations_by_name.values()
+                if location.item is not None and location.item.player == player and location.item.advancement)
+    return SlotPlaythrough(tuple(spheres), beatable, tuple(required), progression == local)
@@ -0,0 +1,143 @@
+import atexit
+import logging
+import os
+from collections import Counter
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+from worlds.generic.Rules import CollectionRule
+from .logic import Requirements, describe
+from .constants.capabilities import CAPABILITIES
+
+# Opt-in instrumentation of the installed access rules. Set the environment variable
+# PSEUDOREGALIA_PROFILE_RULES before generating, or assign a RuleProfile to rule_profile before set_rules,
+# and every entrance and location rule installed afterwards records its calls into it. With the environment variable
+# set, the ranked report is logged when the process exits, after the accessibility check and spoiler playthrough
+# that run alongside and after generate_output.
+
+
+class RuleStats:
+    __slots__ = ("requirements", "calls", "time", "hits", "vectors", "repeats")
+    requirements: Requirements
+    calls: int
+    time: float
+    # Calls satisfied by each alternative of requirements, in order, followed by calls that were False.
+    hits: List[int]
+    # Calls per capability vector the rule was tested against.
+    vectors: Counter
+    # Calls with the same capability vector as the previous call for the same player, which a memo keyed on the
+    # player's inventory would have answered.
+    repeats: int
+
+    def __init__(self, requirements: Requirements) -> None:
+        self.requirements = requirements
+        self.calls = 0
+        self.time = 0.0
+        self.hits = [0] * (len(requirements) + 1)
+        self.vectors = Counter()
+        self.repeats = 0
+
+    @property
+    def true(self) -> int:
+        return self.calls - self.hits[-1]
+
+
+class RuleProfile:
+    """Call counts, outcomes, the alternative that satisfied each call, and cumulative time per rule.
+    Rules with the same name and requirements are merged across players."""
+    stats: Dict[Tuple[str, Requirements], RuleStats]
+
+    def __init__(self) -> None:
+        self.stats = {}
+
+    def to_access_rule(self, name: str, requirements: Requirements, player: int) -> CollectionRule:
+        """Same as rules.to_access_rule, but records every call into the stats for name and requirements.
+        The rules are closures, so a profiled multiworld can't be pickled."""
+        stats = self.stats.get((name, requirements))
+        if stats is None:
+            stats = self.stats[name, requirements] = RuleStats(requirements)
+        hits = stats.hits
+        vectors = stats.vectors
+        miss = len(requirements)
+        previous = None
+
+        def rule(state) -> bool:
+            nonlocal previous
+            start = perf_counter()
+            vector = state.prog_items[player][CAPABILITIES]
+            hit = miss
+            for index, capabilities in enumerate(requirements):
+                if vector & capabilities == capabilities:
+                    hit = index
+                    break
+            stats.time += perf_counter() - start
+            stats.calls += 1
+            hits[hit] += 1
+            vectors[vector] += 1
+            if vector == previous:
+                stats.repeats += 1
+            previous = vector
+            return hit != miss
+        return rule
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """Ranks rules by cumulative time, listing how often each alternative satisfied the rule."""
+        ranked = sorted(self.stats.items(), key=lambda entry: entry[1].time, reverse=True)[:limit]
+        calls = sum(stats.calls for stats in self.stats.values())
+        repeats = sum(stats.repeats for stats in self.stats.values())
+        lines = [f"{calls} calls, {repeats} ({repeats / calls if calls else 0.0:.1%}) repeated the previous "
+                 f"capability vector", f"{'time ms':>9} {'calls':>8} {'true':>7}  rule"]
+        for (name, _), stats in ranked:
+            true_rate = stats.true / stats.calls if stats.calls else 0.0
+            lines.append(f"{stats.time * 1000:9.3f} {stats.calls:8} {true_rate:7.1%}  {name}")
+            for capabilities, hits in zip(stats.requirements, stats.hits):
+                lines.append(f"{'':27}{hits:8}  {describe((capabilities,))}")
+        return "\n".join(lines)
+
+    def get_alternative_orders(self) -> Dict[str, List[Requirements]]:
+        """Returns order_alternatives for every profiled rule with more than one alternative, by rule name."""
+        orders: Dict[str, List[Requirements]] = {}
+        for (name, requirements), stats in self.stats.items():
+            if len(requirements) > 1 and stats.calls:
+                orders.setdefault(name, []).append(order_alternatives(requirements, stats.vectors))
+        return orders
+
+
+def count_tests(requirements: Requirements, vectors: Counter) -> int:
+    """Returns how many alternatives an access rule tests to answer every call in vectors."""
+    tests = 0
+    for vector, calls in vectors.items():
+        tested = len(requirements)
+        for index, capabilities in enumerate(requirements, 1):
+            if vector & capabilities == capabilities:
+                tested = index
+                break
+        tests += tested * calls
+    return tests
+
+
+def order_alternatives(requirements: Requirements, vectors: Counter) -> Requirements:
+    """Orders alternatives so the recorded calls in vectors are answered with as few tests as possible,
+    greedily putting first the alternative that satisfies the most calls not satisfied by earlier ones.
+    Ties keep their order in requirements."""
+    remaining = dict(vectors)
+    unordered = list(requirements)
+    ordered = []
+    while unordered:
+        best = max(unordered, key=lambda capabilities: sum(
+            calls for vector, calls in remaining.items() if vector & capabilities == capabilities))
+        unordered.remove(best)
+        ordered.append(best)
+        remaining = {vector: calls for vector, calls in remaining.items() if vector & best != best}
+    return tuple(ordered)
+
+
+rule_profile: Optional[RuleProfile] = RuleProfile() if os.environ.get("PSEUDOREGALIA_PROFILE_RULES") else None
+
+
+def log_report() -> None:
+    if rule_profile is not None:
+        logging.info(f"Pseudoregalia rule profile:\n{rule_profile.report()}")
+
+
+if rule_profile is not None:
+    atexit.register(log_report)
@@ -0,0 +1,198 @@
+import hashlib
+import itertools
+import os
+import pickle
+from collections import Counter
+from typing import Dict, NamedTuple, Tuple, TYPE_CHECKING
+import Utils
+from BaseClasses import ItemClassification
+from .items import item_table
+from .logic import Requirements, TRUE
+from .locations import location_table
+from .regions import region_table
+from .rules import get_capabilities
+from .templates import get_template, get_template_key
+from .constants.capabilities import PLUNGE, GEM, LIGHT, MAJOR_KEYS, BREAKER_LEVELS, SLIDE_LEVELS, KICKS, SMALL_KEYS
+
+if TYPE_CHECKING:
+    from . import PseudoregaliaWorld
+
+# Maps a capability vector to bitsets of the regions and locations reachable with it.
+ReachabilityTable = Dict[int, Tuple[int, int]]
+
+region_bits: Dict[str, int] = {name: 1 << index for index, name in enumerate(region_table)}
+location_bits: Dict[str, int] = {name: 1 << index for index, name in enumerate(location_table)}
+
+# Every capability vector get_capabilities can produce.
+capability_space: Tuple[int, ...] = tuple(
+    sum(capabilities) for capabilities in itertools.product(
+        BREAKER_LEVELS, SLIDE_LEVELS, KICKS, (0, PLUNGE), (0, GEM), (0, LIGHT),
+        (0, SMALL_KEYS[6], SMALL_KEYS[7]), (0, MAJOR_KEYS)))
+
+# Bump whenever build_table changes meaning without changing the requirement tables,
+# so tables cached by an older version aren't used.
+table_version = 2
+
+_tables: Dict[Tuple[int, ...], ReachabilityTable] = {}
+
+
+class Frontier(NamedTuple):
+    """What a player can reach from Menu with a fixed capability vector, in region_table and location_table order."""
+    capabilities: int
+    regions: Tuple[str, ...]
+    locations: Tuple[str, ...]
+
+
+# Frontiers before any item is found, keyed by table key and template key.
+_start_frontiers: Dict[Tuple, Tuple[Frontier, Frontier]] = {}
+
+# Fewest new locations a single item has to open up from the start frontier to count as an early enabler.
+early_enabler_locations = 5
+
+# Early enablers, keyed like _start_frontiers.
+_early_enablers: Dict[Tuple, Tuple[str, ...]] = {}
+
+
+def get_table_key(world: "PseudoregaliaWorld") -> Tuple[int, ...]:
+    # Progressive options only change which items grant a capability, not the table.
+    options = world.options
+    return options.logic_level.value, int(bool(options.obscure_logic)), int(bool(options.split_sun_greaves))
+
+
+def is_satisfied(requirements: Requirements, capabilities: int) -> bool:
+    for required in requirements:
+        if capabilities & required == required:
+            return True
+    return False
+
+
+def build_table(world: "PseudoregaliaWorld") -> ReachabilityTable:
+    """Evaluates the world's installed requirement tables for every capability vector. The access rules aren't
+    called, so building doesn't show up in a rule profile and works the same before set_rules.
+    Only valid after create_regions."""
+    always = TRUE.requirements()
+    rules = world.rules_class
+    region_requirements, location_requirements = rules.get_installed_requirement_tables(world)
+    region_exits = {region: [(exit, region_requirements.get(f"{region} -> {exit}", always)) for exit in exits]
+                    for region, exits in rules.get_region_exits(world).items()}
+    locations = [(location.parent_region.name, location_bits[location.name],
+                  location_requirements.get(location.name, always))
+                 for location in world.locations_by_name.values() if location.name in location_bits]
+    table = {}
+    for capabilities in capability_space:
+        reachable = {"Menu"}
+        queue = ["Menu"]
+        while queue:
+            for exit, requirements in region_exits[queue.pop()]:
+                if exit not in reachable and is_satisfied(requirements, capabilities):
+                    reachable.add(exit)
+                    queue.append(exit)
+        regions = 0
+        for region in reachable:
+            regions |= region_bits[region]
+        reachable_locations = 0
+        for region, bit, requirements in locations:
+            if region in reachable and is_satisfied(requirements, capabilities):
+                reachable_locations |= bit
+        table[capabilities] = (regions, reachable_locations)
+    return table
+
+
+def get_cache_file(world: "PseudoregaliaWorld", key: Tuple[int, ...]) -> str:
+    """Names the cache file by everything the table is built from: the installed requirements, the region graph,
+    the region of every location and the bit of every region, location and capability vector."""
+    region_requirements, location_requirements = world.rules_class.get_installed_requirement_tables(world)
+    inputs = (
+        table_version, key, tuple(region_bits), tuple(location_bits), capability_space,
+        sorted(region_requirements.items()), sorted(location_requirements.items()),
+        sorted((region, sorted(exits)) for region, exits in world.rules_class.get_region_exits(world).items()),
+        sorted((location.name, location.parent_region.name) for location in world.locations_by_name.values()))
+    digest = hashlib.sha256(repr(inputs).encode())
+    return Utils.cache_path("pseudoregalia", "reachability", f"{digest.hexdigest()}.pickle")
+
+
+def get_table(world: "PseudoregaliaWorld") -> ReachabilityTable:
+    """Returns the reachability table for the world's options, building it on first use.
+    Tables are cached in memory and on disk. Only valid after create_regions."""
+    key = get_table_key(world)
+    if key in _tables:
+        return _tables[key]
+
+    cache_file = get_cache_file(world, key)
+    try:
+        with open(cache_file, "rb") as file:
+            table = pickle.load(file)
+        if not isinstance(table, dict) or len(table) != len(capability_space):
+            raise ValueError(f"{cache_file} doesn't hold a reachability table")
+    except Exception:
+        # Missing, truncated or written by an incompatible version, any of which pickle can raise almost anything for.
+        table = build_table(world)
+        # Generators running in parallel may build the same table, so each writes its own file and moves it
+        # into place, which replaces the cache file atomically.
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(temp_file, "wb") as file:
+                pickle.dump(table, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            # The table still works, it just gets rebuilt next time.
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+    _tables[key] = table
+    return table
+
+
+def get_frontier(table: ReachabilityTable, capabilities: int) -> Frontier:
+    regions, locations = table[capabilities]
+    return Frontier(capabilities,
+                    tuple(name for name, bit in region_bits.items() if regions & bit),
+                    tuple(name for name, bit in location_bits.items() if locations & bit))
+
+
+def get_start_frontiers(world: "PseudoregaliaWorld") -> Tuple[Frontier, Frontier]:
+    """Returns what's reachable with no items, and with the locked items collected as their locations become
+    reachable without any other item, e.g. the Dream Breaker and what it opens. Both only depend on options,
+    so they're computed once per combination. Only valid after create_regions."""
+    key = (get_table_key(world), get_template_key(world))
+    frontiers = _start_frontiers.get(key)
+    if frontiers is None:
+        table = get_table(world)
+        locked_items = get_template(world).locked_items
+        empty = get_frontier(table, 0)
+        collected = Counter()
+        frontier = empty
+        while True:
+            found = [locked_items[name] for name in frontier.locations if name in locked_items]
+            if len(found) == sum(collected.values()):
+                break
+            collected = Counter(found)
+            frontier = get_frontier(table, get_capabilities(collected))
+        frontiers = _start_frontiers[key] = (empty, frontier)
+    return frontiers
+
+
+def get_early_enablers(world: "PseudoregaliaWorld") -> Tuple[str, ...]:
+    """Returns the progression items in the world's pool that each open up at least early_enabler_locations
+    new item locations from the start frontier on their own, in item_table order. Only valid after create_regions."""
+    key = (get_table_key(world), get_template_key(world))
+    enablers = _early_enablers.get(key)
+    if enablers is None:
+        table = get_table(world)
+        template = get_template(world)
+        frontier = get_start_frontiers(world)[1]
+        locked = Counter(template.locked_items[name] for name in frontier.locations if name in template.locked_items)
+        # Only locations holding items count, not events like unlocking a door.
+        item_locations = sum(bit for name, bit in location_bits.items() if location_table[name].code is not None)
+        reached = sum(1 for name in frontier.locations if location_table[name].code is not None)
+        enablers = []
+        for name in template.item_counts:
+            if not item_table[name].classification & ItemClassification.progression:
+                continue
+            locations = table[get_capabilities(locked + Counter((name,)))][1] & item_locations
+            if bin(locations).count("1") - reached >= early_enabler_locations:
+                enablers.append(name)
+        enablers = _early_enablers[key] = tuple(enablers)
+    return enablers
@@ -1,7 +1,19 @@
-from BaseClasses import CollectionState
-from typing import Dict, Callable, TYPE_CHECKING
-from worlds.generic.Rules import add_rule, set_rule, CollectionRule
+import json
+import pkgutil
+from collections import Counter
+from functools import partial, reduce
+from operator import or_
+from typing import Callable, ClassVar, Dict, List, Tuple, TYPE_CHECKING
+from worlds.generic.Rules import set_rule, CollectionRule
+from . import condensation, profiling
+from .condensation import RegionExits
+from .locations import location_table
+from .regions import region_table
+from .logic import (Rule, Requirements, LogicContext, Or, TRUE, Strikebreak, SoulCutter, Slide, SlideJump, Plunge,
+                    Gem, SmallKeys, Kicks, MajorKeys, describe)
 from .constants.difficulties import NORMAL
+from .constants.capabilities import (STRIKEBREAK, SOUL_CUTTER, SLIDEJUMP, PLUNGE, GEM, LIGHT, MAJOR_KEYS,
+                                     BREAKER_LEVELS, SLIDE_LEVELS, KICKS, SMALL_KEYS, CAPABILITIES)
 
 if TYPE_CHECKING:
     from . import PseudoregaliaWorld
@@ -9,16 +21,179 @@ else:
     PseudoregaliaWorld = object
 
 
+major_key_names = (
+    "Major Key - Empty Bailey",
+    "Major Key - The Underbelly",
+    "Major Key - Tower Remains",
+    "Major Key - Sansa Keep",
+    "Major Key - Twilight Theatre",
+)
+
+
+def get_breaker_capabilities(items: Counter) -> int:
+    breaker = items.get("Progressive Dream Breaker", 0)
+    if items.get("Dream Breaker"):
+        if not items.get("Strikebreak"):
+            breaker = max(breaker, 1)
+        elif not items.get("Soul Cutter"):
+            breaker = max(breaker, 2)
+        else:
+            breaker = 3
+    return BREAKER_LEVELS[min(breaker, 3)]
+
+
+def get_slide_capabilities(items: Counter) -> int:
+    slide = items.get("Progressive Slide", 0)
+    if items.get("Slide"):
+        slide = max(slide, 2 if items.get("Solar Wind") else 1)
+    return SLIDE_LEVELS[min(slide, 2)]
+
+
+def get_kick_capabilities(items: Counter) -> int:
+    kicks = items.get("Heliacal Power", 0) + items.get("Air Kick", 0)
+    if items.get("Sun Greaves"):
+        kicks += 3
+    return KICKS[min(kicks, 4)]
+
+
+def get_small_key_capabilities(items: Counter) -> int:
+    small_keys = items.get("Small Key", 0)
+    return SMALL_KEYS[min(small_keys, 7)] if small_keys >= 6 else 0
+
+
+def get_major_key_capabilities(items: Counter) -> int:
+    return MAJOR_KEYS if all(items.get(name) for name in major_key_names) else 0
+
+
+def get_item_capabilities(name: str, capabilities: int) -> Callable[[Counter], int]:
+    return lambda items: capabilities if items.get(name) else 0
+
+
+# Capability bits collecting each item can change, and the function recomputing those bits.
+# Items missing from here never change the capability vector.
+item_capabilities: Dict[str, Tuple[int, Callable[[Counter], int]]] = {
+    "Dream Breaker": (BREAKER_LEVELS[3], get_breaker_capabilities),
+    "Strikebreak": (STRIKEBREAK | SOUL_CUTTER, get_breaker_capabilities),
+    "Soul Cutter": (SOUL_CUTTER, get_breaker_capabilities),
+    "Progressive Dream Breaker": (BREAKER_LEVELS[3], get_breaker_capabilities),
+    "Slide": (SLIDE_LEVELS[2], get_slide_capabilities),
+    "Solar Wind": (SLIDEJUMP, get_slide_capabilities),
+    "Progressive Slide": (SLIDE_LEVELS[2], get_slide_capabilities),
+    "Sun Greaves": (KICKS[4], get_kick_capabilities),
+    "Heliacal Power": (KICKS[4], get_kick_capabilities),
+    "Air Kick": (KICKS[4], get_kick_capabilities),
+    "Sunsetter": (PLUNGE, get_item_capabilities("Sunsetter", PLUNGE)),
+    "Cling Gem": (GEM, get_item_capabilities("Cling Gem", GEM)),
+    "Ascendant Light": (LIGHT, get_item_capabilities("Ascendant Light", LIGHT)),
+    "Small Key": (SMALL_KEYS[7], get_small_key_capabilities),
+    **{name: (MAJOR_KEYS, get_major_key_capabilities) for name in major_key_names},
+}
+
+# Set to True to check every incremental update in update_capabilities against a full get_capabilities.
+verify_capabilities = False
+
+
+def get_capabilities(items: Counter) -> int:
+    """Packs a player's collected progression into the capability vector that rules are tested against."""
+    return (get_breaker_capabilities(items) | get_slide_capabilities(items) | get_kick_capabilities(items)
+            | get_small_key_capabilities(items) | get_major_key_capabilities(items)
+            | (PLUNGE if items.get("Sunsetter") else 0)
+            | (GEM if items.get("Cling Gem") else 0)
+            | (LIGHT if items.get("Ascendant Light") else 0))
+
+
+def update_capabilities(items: Counter, name: str) -> None:
+    """Updates the capability vector in a player's prog_items after collecting or removing the item name.
+    Only the bits the item can change are recomputed, see item_capabilities.
+    Called by PseudoregaliaWorld.collect and remove."""
+    capabilities = item_capabilities.get(name)
+    if capabilities is None:
+        return
+    bits, get_bits = capabilities
+    items[CAPABILITIES] = items[CAPABILITIES] & ~bits | get_bits(items) & bits
+    if verify_capabilities:
+        assert items[CAPABILITIES] == get_capabilities(items), f"Capability vector drifted after {name}"
+
+
+# Minimal requirements of every entrance and location with clauses, in that order.
+RequirementTables = Tuple[Dict[str, Requirements], Dict[str, Requirements]]
+
+
+def load_alternative_orders() -> Dict[str, List[Requirements]]:
+    """Loads the preferred order of each rule's alternatives, written by tools/order_alternatives.py
+    from the calls recorded while profiling benchmark sweeps."""
+    try:
+        data = pkgutil.get_data(__package__, "data/alternative_order.json")
+    except OSError:
+        return {}
+    return {name: [tuple(order) for order in orders] for name, orders in json.loads(data).items()}
+
+
+# Empty to keep the order minimize gives alternatives, fewest capabilities first.
+alternative_orders: Dict[str, List[Requirements]] = load_alternative_orders()
+
+
+def order_requirements(name: str, requirements: Requirements) -> Requirements:
+    """Reorders requirements by the preferred order recorded for name, if one was recorded for the same
+    alternatives. Access rules test alternatives in order, so the ones most likely to pass should go first."""
+    for order in alternative_orders.get(name, ()):
+        if len(order) == len(requirements) and set(order) == set(requirements):
+            return order
+    return requirements
+
+
+# Access rules are partials of these module level functions rather than closures, so a multiworld with
+# Pseudoregalia players can be pickled, e.g. to hand it to worker processes.
+
+def never(state) -> bool:
+    return False
+
+
+def has_capabilities(player: int, capabilities: int, state) -> bool:
+    return state.prog_items[player][CAPABILITIES] & capabilities == capabilities
+
+
+def has_any_capabilities(player: int, requirements: Requirements, state) -> bool:
+    vector = state.prog_items[player][CAPABILITIES]
+    for capabilities in requirements:
+        if vector & capabilities == capabilities:
+            return True
+    return False
+
+
+def has_completed(player: int, state) -> bool:
+    return state.has("Something Worth Being Awake For", player)
+
+
+def to_access_rule(requirements: Requirements, player: int) -> CollectionRule:
+    """Lowers requirements to an access rule testing the player's capability vector."""
+    if not requirements:
+        return never
+    if len(requirements) == 1:
+        return partial(has_capabilities, player, requirements[0])
+    return partial(has_any_capabilities, player, requirements)
+
+
+def get_rule_dependencies(requirement_tables: RequirementTables) -> Dict[str, Tuple[str, ...]]:
+    """Maps every item in item_capabilities to the entrances and locations whose requirements it can change.
+    Items mapped to an empty tuple are logically inert for these tables."""
+    referenced = [(name, reduce(or_, requirements, 0))
+                  for table in requirement_tables for name, requirements in table.items()]
+    return {item: tuple(name for name, capabilities in referenced if capabilities & bits)
+            for item, (bits, _) in item_capabilities.items()}
+
+
 class PseudoregaliaRulesHelpers:
     world: PseudoregaliaWorld
     player: int
-    region_rules: dict[str, list[CollectionRule]]
-    location_rules: dict[str, list[CollectionRule]]
+    region_rules: dict[str, list[Rule]]
+    location_rules: dict[str, list[Rule]]
     # Empty list or missing keys are True, any False rules need to be explicit, multiple rules are ORd together
     # Classes instantiated in difficulty order and append new clauses to rules,
-    # add_rule applies them backwards meaning harder rules will shortcircuit easier rules
+    # compile_clauses reduces them to minimal requirements so clauses covered by another clause drop out
 
     required_small_keys: int = 6  # Set to 7 for Normal logic.
+    context: LogicContext
 
     def __init__(self, world: PseudoregaliaWorld) -> None:
         self.world = world
@@ -27,77 +202,71 @@ class PseudoregaliaRulesHelpers:
         self.location_rules = {}
 
         region_clauses = {
-            "Empty Bailey -> Castle Main": lambda state: True,
-            "Empty Bailey -> Theatre Pillar": lambda state: True,
-            "Empty Bailey -> Tower Remains": lambda state:
-                self.has_gem(state)
-                or self.has_slide(state) and self.has_plunge(state)
-                or self.get_kicks(state, 1),
-            "Tower Remains -> Underbelly Little Guy": lambda state:
-                self.has_plunge(state),
-            "Tower Remains -> The Great Door": lambda state:
-                self.has_gem(state) and self.get_kicks(state, 3),
-            "Theatre Main -> Keep Main": lambda state:
-                self.has_gem(state),
-            "Theatre Pillar -> Theatre Main": lambda state:
-                state.has_all({"Sunsetter", "Cling Gem"}, self.player)
-                or self.has_plunge(state) and self.get_kicks(state, 4),
-            "Theatre Outside Scythe Corridor -> Theatre Main": lambda state:
-                self.has_gem(state) and self.get_kicks(state, 3)
-                or self.has_gem(state) and self.can_slidejump(state),
+            "Empty Bailey -> Castle Main": TRUE,
+            "Empty Bailey -> Theatre Pillar": TRUE,
+            "Empty Bailey -> Tower Remains":
+                Gem
+                | Slide & Plunge
+                | Kicks(1),
+            "Tower Remains -> Underbelly Little Guy":
+                Plunge,
+            "Tower Remains -> The Great Door":
+                Gem & Kicks(3),
+            "Theatre Main -> Keep Main":
+                Gem,
+            "Theatre Pillar -> Theatre Main":
+                Plunge & Gem
+                | Plunge & Kicks(4),
+            "Theatre Outside Scythe Corridor -> Theatre Main":
+                Gem & Kicks(3)
+                | Gem & SlideJump,
         }
 
         location_clauses = {
-            "Empty Bailey - Solar Wind": lambda state:
-                self.has_slide(state),
-            "Empty Bailey - Cheese Bell": lambda state:
-                self.can_slidejump(state) and self.get_kicks(state, 1) and self.has_plunge(state)
-                or self.can_slidejump(state) and self.has_gem(state)
-                or self.get_kicks(state, 3) and self.has_plunge(state),
-            "Empty Bailey - Inside Building": lambda state:
-                self.has_slide(state),
-            "Empty Bailey - Center Steeple": lambda state:
-                self.get_kicks(state, 3)
-                or self.has_slide(state) and self.has_plunge(state),
-            "Empty Bailey - Guarded Hand": lambda state:
-                self.has_plunge(state)
-                or self.has_gem(state)
-                or self.get_kicks(state, 3),
-            "Twilight Theatre - Soul Cutter": lambda state:
-                self.can_strikebreak(state),
-            "Twilight Theatre - Corner Beam": lambda state:
-                self.has_gem(state) and self.get_kicks(state, 3)
-                or self.has_gem(state) and self.can_slidejump(state)
-                or self.get_kicks(state, 3) and self.can_slidejump(state),
-            "Twilight Theatre - Locked Door": lambda state:
-                self.has_small_keys(state)
-                and (
-                    self.has_gem(state)
-                    or self.get_kicks(state, 3)),
-            "Twilight Theatre - Back Of Auditorium": lambda state:
-                self.get_kicks(state, 3)
-                or self.has_gem(state),
-            "Twilight Theatre - Murderous Goat": lambda state: True,
-            "Twilight Theatre - Center Stage": lambda state:
-                self.can_soulcutter(state) and self.has_gem(state) and self.can_slidejump(state)
-                or self.can_soulcutter(state) and self.has_gem(state) and self.get_kicks(state, 1),
-            "Tower Remains - Cling Gem": lambda state:
-                self.get_kicks(state, 3),
-            "Tower Remains - Atop The Tower": lambda state: True,
+            "Empty Bailey - Solar Wind":
+                Slide,
+            "Empty Bailey - Cheese Bell":
+                SlideJump & Kicks(1) & Plunge
+                | SlideJump & Gem
+                | Kicks(3) & Plunge,
+            "Empty Bailey - Inside Building":
+                Slide,
+            "Empty Bailey - Center Steeple":
+                Kicks(3)
+                | Slide & Plunge,
+            "Empty Bailey - Guarded Hand":
+                Plunge
+                | Gem
+                | Kicks(3),
+            "Twilight Theatre - Soul Cutter":
+                Strikebreak,
+            "Twilight Theatre - Corner Beam":
+                Gem & Kicks(3)
+                | Gem & SlideJump
+                | Kicks(3) & SlideJump,
+            "Twilight Theatre - Locked Door":
+                SmallKeys
+                & (
+                    Gem
+                    | Kicks(3)),
+            "Twilight Theatre - Back Of Auditorium":
+                Kicks(3)
+                | Gem,
+            "Twilight Theatre - Murderous Goat": TRUE,
+            "Twilight Theatre - Center Stage":
+                SoulCutter & Gem & SlideJump
+                | SoulCutter & Gem & Kicks(1),
+            "Tower Remains - Cling Gem":
+                Kicks(3),
+            "Tower Remains - Atop The Tower": TRUE,
         }
 
         self.apply_clauses(region_clauses, location_clauses)
 
         logic_level = world.options.logic_level.value
-        if bool(world.options.obscure_logic):
-            self.knows_obscure = lambda state: True
-            self.can_attack = lambda state: self.has_breaker(state) or self.has_plunge(state)
-        else:
-            self.knows_obscure = lambda state: False
-            self.can_attack = lambda state: self.has_breaker(state)
-
         if logic_level == NORMAL:
             self.required_small_keys = 7
+        self.context = LogicContext(bool(world.options.obscure_logic), self.required_small_keys)
 
     def apply_clauses(self, region_clauses, location_clauses):
         for name, rule in region_clauses.items():
@@ -109,103 +278,115 @@ class PseudoregaliaRulesHelpers:
                 self.location_rules[name] = []
             self.location_rules[name].append(rule)
 
-    def has_breaker(self, state) -> bool:
-        return state.has_any({"Dream Breaker", "Progressive Dream Breaker"}, self.player)
-
-    def has_slide(self, state) -> bool:
-        return state.has_any({"Slide", "Progressive Slide"}, self.player)
-
-    def has_plunge(self, state) -> bool:
-        return state.has("Sunsetter", self.player)
-
-    def has_gem(self, state) -> bool:
-        return state.has("Cling Gem", self.player)
-
-    def can_bounce(self, state) -> bool:
-        return self.has_breaker(state) and state.has("Ascendant Light", self.player)
-
-    def can_attack(self, state) -> bool:
-        """Used where either breaker or sunsetter will work, for example on switches.
-        Using sunsetter is considered Obscure Logic by this method."""
-        raise Exception("can_attack() was not set")
-
-    def get_kicks(self, state, count: int) -> bool:
-        kicks: int = 0
-        if (state.has("Sun Greaves", self.player)):
-            kicks += 3
-        kicks += state.count("Heliacal Power", self.player)
-        kicks += state.count("Air Kick", self.player)
-        return kicks >= count
-
-    def kick_or_plunge(self, state, count: int) -> bool:
-        """Used where one air kick can be replaced with sunsetter.
-        Input is the number of kicks needed without plunge."""
-        total: int = 0
-        if (state.has("Sun Greaves", self.player)):
-            total += 3
-        if (state.has("Sunsetter", self.player)):
-            total += 1
-        total += state.count("Heliacal Power", self.player)
-        total += state.count("Air Kick", self.player)
-        return total >= count
-
-    def has_small_keys(self, state) -> bool:
-        if not self.can_attack(state):
-            return False
-        return state.count("Small Key", self.player) >= self.required_small_keys
-
-    def navigate_darkrooms(self, state) -> bool:
-        # TODO: Update this to check obscure tricks for breaker only when logic rework nears completion
-        return self.has_breaker(state) or state.has("Ascendant Light", self.player)
-
-    def can_slidejump(self, state) -> bool:
-        return (state.has_all({"Slide", "Solar Wind"}, self.player)
-                or state.count("Progressive Slide", self.player) >= 2)
-
-    def can_strikebreak(self, state) -> bool:
-        return (state.has_all({"Dream Breaker", "Strikebreak"}, self.player)
-                or state.count("Progressive Dream Breaker", self.player) >= 2)
-
-    def can_soulcutter(self, state) -> bool:
-        return (state.has_all({"Dream Breaker", "Strikebreak", "Soul Cutter"}, self.player)
-                or state.count("Progressive Dream Breaker", self.player) >= 3)
-
-    def knows_obscure(self, state) -> bool:
-        """True when Obscure Logic is enabled, False when it isn't."""
-        raise Exception("knows_obscure() was not set")
-
-    def set_pseudoregalia_rules(self) -> None:
-        world = self.world
-        multiworld = self.world.multiworld
-        split_kicks = bool(world.options.split_sun_greaves)
-
-        for name, rules in self.region_rules.items():
-            entrance = multiworld.get_entrance(name, self.player)
-            for index, rule in enumerate(rules):
-                if index == 0:
-                    set_rule(entrance, rule)
-                else:
-                    add_rule(entrance, rule, "or")
-        for name, rules in self.location_rules.items():
-            if name.startswith("Listless Library"):
-                if split_kicks and name.endswith("Greaves"):
-                    continue
-                if not split_kicks and name[-1].isdigit():
-                    continue
-            location = multiworld.get_location(name, self.player)
-            for index, rule in enumerate(rules):
-                if index == 0:
-                    set_rule(location, rule)
-                else:
-                    add_rule(location, rule, "or")
-
-        set_rule(multiworld.get_location("D S T RT ED M M O   Y", self.player), lambda state:
-                 state.has_all({
-                     "Major Key - Empty Bailey",
-                     "Major Key - The Underbelly",
-                     "Major Key - Tower Remains",
-                     "Major Key - Sansa Keep",
-                     "Major Key - Twilight Theatre",
-                 }, self.player))
-        multiworld.completion_condition[self.player] = lambda state: state.has(
-            "Something Worth Being Awake For", self.player)
+    def compile_clauses(self, clauses: list[Rule]) -> Requirements:
+        """ORs together the clauses for one entrance or location and reduces them to their minimal requirements
+        for the player's options. Clauses made redundant by other clauses drop out here."""
+        if not clauses:
+            return TRUE.requirements()
+        return Or(*reversed(clauses)).resolve(self.context).requirements()
+
+    def get_requirement_tables(self) -> RequirementTables:
+        """Returns the minimal requirements of every entrance and location with clauses, in that order."""
+        entrances = {f"{region} -> {exit}" for region, exits in region_table.items() for exit in exits}
+        unknown = [name for name in self.region_rules if name not in entrances]
+        unknown += [name for name in self.location_rules if name not in location_table]
+        assert not unknown, f"Rules for entrances or locations that don't exist: {', '.join(unknown)}"
+        return ({name: self.compile_clauses(clauses) for name, clauses in self.region_rules.items()},
+                {name: self.compile_clauses(clauses) for name, clauses in self.location_rules.items()})
+
+    def dump_requirement_tables(self) -> str:
+        """Formats the requirement tables one rule per line, for reviewing what the clauses reduce to."""
+        lines = []
+        for table in self.get_requirement_tables():
+            lines.extend(f"{name}: {describe(requirements)}" for name, requirements in table.items())
+        return "\n".join(lines)
+
+    # Requirement tables only depend on the logic level and obscure logic, so they're compiled once per
+    # combination and shared by every player who picked it, with alternatives in their preferred order.
+    # Keyed by rules class and obscure logic.
+    shared_requirement_tables: ClassVar[Dict[Tuple[type, bool], RequirementTables]] = {}
+
+    @classmethod
+    def get_shared_requirement_tables(cls, world: PseudoregaliaWorld) -> RequirementTables:
+        key = (cls, bool(world.options.obscure_logic))
+        tables = cls.shared_requirement_tables.get(key)
+        if tables is None:
+            tables = tuple({name: order_requirements(name, requirements) for name, requirements in table.items()}
+                           for table in cls(world).get_requirement_tables())
+            cls.shared_requirement_tables[key] = tables
+        return tables
+
+    # The exits created for each player, condensed unless condensation.condense_regions is off. Region requirements
+    # don't depend on split sun greaves, so they're keyed by rules class and obscure logic.
+    shared_region_exits: ClassVar[Dict[Tuple[type, bool], RegionExits]] = {}
+
+    @classmethod
+    def get_region_exits(cls, world: PseudoregaliaWorld) -> RegionExits:
+        """Returns the exits to create from each region with their requirements, see condensation.py."""
+        key = (cls, bool(world.options.obscure_logic))
+        exits = cls.shared_region_exits.get(key)
+        if exits is None:
+            region_requirements = cls.get_shared_requirement_tables(world)[0]
+            build = condensation.condense if condensation.condense_regions else condensation.uncondensed
+            exits = cls.shared_region_exits[key] = build(region_table, region_requirements)
+        return exits
+
+    # Entrances and locations each player's rules are actually installed on, with their dependency index.
+    # Keyed by rules class, obscure logic and split sun greaves.
+    shared_rule_dependencies: ClassVar[Dict[Tuple[type, bool, bool], Dict[str, Tuple[str, ...]]]] = {}
+
+    @classmethod
+    def get_installed_requirement_tables(cls, world: PseudoregaliaWorld) -> RequirementTables:
+        """Returns the requirement tables without the always true rules and the locations that don't exist
+        for the player's options, e.g. the Listless Library locations not used with their split sun greaves option.
+        Entrances are the ones get_region_exits creates. Only valid after create_regions."""
+        always = TRUE.requirements()
+        location_requirements = cls.get_shared_requirement_tables(world)[1]
+        region_requirements = {
+            f"{region} -> {exit}": requirements
+            for region, exits in cls.get_region_exits(world).items() for exit, requirements in exits.items()}
+
+        installed_locations = {}
+        for name, requirements in location_requirements.items():
+            if name in world.locations_by_name and requirements != always:
+                installed_locations[name] = requirements
+        installed_locations["D S T RT ED M M O   Y"] = MajorKeys.requirements()
+        return ({name: requirements for name, requirements in region_requirements.items() if requirements != always},
+                installed_locations)
+
+    @classmethod
+    def get_shared_rule_dependencies(cls, world: PseudoregaliaWorld) -> Dict[str, Tuple[str, ...]]:
+        """Returns get_rule_dependencies for the rules installed on the player's world."""
+        key = (cls, bool(world.options.obscure_logic), bool(world.options.split_sun_greaves))
+        dependencies = cls.shared_rule_dependencies.get(key)
+        if dependencies is None:
+            dependencies = get_rule_dependencies(cls.get_installed_requirement_tables(world))
+            cls.shared_rule_dependencies[key] = dependencies
+        return dependencies
+
+    @classmethod
+    def set_pseudoregalia_rules(cls, world: PseudoregaliaWorld) -> None:
+        player = world.player
+        multiworld = world.multiworld
+        entrances = world.entrances_by_name
+        locations = world.locations_by_name
+
+        # Entrances and locations with the same requirements share one access rule, unless they're being profiled.
+        access_rules: Dict[Requirements, CollectionRule] = {}
+        rule_profile = profiling.rule_profile
+
+        def get_access_rule(name: str, requirements: Requirements) -> CollectionRule:
+            if rule_profile is not None:
+                return rule_profile.to_access_rule(name, requirements, player)
+            rule = access_rules.get(requirements)
+            if rule is None:
+                rule = access_rules[requirements] = to_access_rule(requirements, player)
+            return rule
+
+        region_requirements, location_requirements = cls.get_installed_requirement_tables(world)
+        for name, requirements in region_requirements.items():
+            set_rule(entrances[name], get_access_rule(name, requirements))
+        for name, requirements in location_requirements.items():
+            set_rule(locations[name], get_access_rule(name, requirements))
+
+        multiworld.completion_condition[player] = partial(has_completed, player)
@@ -1,4 +1,5 @@
 from .rules_hard import PseudoregaliaHardRules
+from .logic import Breaker, Strikebreak, SoulCutter, Slide, Plunge, Gem, Bounce, Attack, Kicks, KickOrPlunge
 
 
 class PseudoregaliaExpertRules(PseudoregaliaHardRules):
@@ -6,174 +7,171 @@ class PseudoregaliaExpertRules(PseudoregaliaHardRules):
         super().__init__(world)
 
         region_clauses = {
-            "Dungeon Escape Lower -> Dungeon Escape Upper": lambda state:
-                self.has_slide(state) and self.get_kicks(state, 1),
-            "Dungeon Escape Upper -> Theatre Outside Scythe Corridor": lambda state:
-                self.has_slide(state),
-            "Castle Main -> Theatre Pillar": lambda state:
-                self.has_slide(state),
-            "Castle Main -> Castle Spiral Climb": lambda state:
-                self.has_slide(state),
-            "Castle Spiral Climb -> Castle High Climb": lambda state:
-                self.has_slide(state)
-                or self.get_kicks(state, 2),
-            "Castle Spiral Climb -> Castle By Scythe Corridor": lambda state:
-                self.kick_or_plunge(state, 4),
-            "Castle By Scythe Corridor -> Castle => Theatre (Front)": lambda state:
-                self.has_slide(state) and self.get_kicks(state, 2),
-            "Castle By Scythe Corridor -> Castle High Climb": lambda state:
-                self.has_slide(state)
-                or self.kick_or_plunge(state, 2),
-            "Castle => Theatre (Front) -> Castle By Scythe Corridor": lambda state:
-                self.has_slide(state)
-                or self.get_kicks(state, 3),
-            "Castle => Theatre (Front) -> Castle Moon Room": lambda state:
-                self.has_slide(state),
-            "Library Main -> Library Top": lambda state:
-                self.has_plunge(state)
-                or self.has_slide(state),
-            "Library Greaves -> Library Top": lambda state:
-                self.has_slide(state),
-            "Library Top -> Library Greaves": lambda state:
-                self.get_kicks(state, 2),
-            "Keep Main -> Keep => Underbelly": lambda state:
-                self.has_slide(state),
-            "Keep Main -> Theatre Outside Scythe Corridor": lambda state:
-                self.has_slide(state),
-            "Underbelly => Dungeon -> Underbelly Ascendant Light": lambda state:
-                self.has_breaker(state)
-                or self.get_kicks(state, 1) and self.has_slide(state),
-            "Underbelly Light Pillar -> Underbelly => Dungeon": lambda state:
-                self.has_slide(state) and self.kick_or_plunge(state, 2),
-            "Underbelly Light Pillar -> Underbelly Ascendant Light": lambda state:
-                self.has_breaker(state)
-                and (
-                    self.get_kicks(state, 2)
-                    or self.get_kicks(state, 1) and self.has_gem(state)
-                    or self.has_slide(state))
-                or self.has_plunge(state)
-                and (
-                    self.has_gem(state)
-                    or self.get_kicks(state, 1)
-                    or self.has_slide(state)),
-            "Underbelly Ascendant Light -> Underbelly => Dungeon": lambda state:
-                self.has_slide(state) and self.get_kicks(state, 1),
-            "Underbelly Main Lower -> Underbelly Hole": lambda state:
-                self.has_plunge(state) and self.has_slide(state),
-            "Underbelly Main Lower -> Underbelly By Heliacal": lambda state:
-                self.has_slide(state),
-            "Underbelly Main Lower -> Underbelly Main Upper": lambda state:
-                self.has_gem(state) and self.kick_or_plunge(state, 1)
-                or self.get_kicks(state, 4)
-                or self.has_slide(state)
-                and (
-                    self.has_gem(state)
-                    or self.get_kicks(state, 3)
-                    or self.get_kicks(state, 1) and self.has_plunge(state)
-                    or self.get_kicks(state, 1) and self.has_breaker(state)),
-            "Underbelly Main Upper -> Underbelly Light Pillar": lambda state:
-                self.has_breaker(state) and self.has_slide(state)
-                or self.has_slide(state) and self.get_kicks(state, 1)
-                or self.has_plunge(state) and self.get_kicks(state, 2)
-                or self.has_gem(state) and self.get_kicks(state, 2),
-            "Underbelly Main Upper -> Underbelly By Heliacal": lambda state:
-                self.has_breaker(state) and self.has_slide(state) and self.get_kicks(state, 2),
-            "Underbelly By Heliacal -> Underbelly Main Upper": lambda state:
-                self.has_plunge(state)
-                or self.has_breaker(state)
-                and (
-                    self.has_slide(state)
-                    or self.has_gem(state)
-                    or self.get_kicks(state, 1))
-                or self.has_slide(state)
-                and (
-                    self.has_gem(state)
-                    or self.get_kicks(state, 2)),
-            "Underbelly Hole -> Underbelly Main Lower": lambda state:
-                self.has_slide(state),
+            "Dungeon Escape Lower -> Dungeon Escape Upper":
+                Slide & Kicks(1),
+            "Dungeon Escape Upper -> Theatre Outside Scythe Corridor":
+                Slide,
+            "Castle Main -> Theatre Pillar":
+                Slide,
+            "Castle Main -> Castle Spiral Climb":
+                Slide,
+            "Castle Spiral Climb -> Castle High Climb":
+                Slide
+                | Kicks(2),
+            "Castle Spiral Climb -> Castle By Scythe Corridor":
+                KickOrPlunge(4),
+            "Castle By Scythe Corridor -> Castle => Theatre (Front)":
+                Slide & Kicks(2),
+            "Castle By Scythe Corridor -> Castle High Climb":
+                Slide
+                | KickOrPlunge(2),
+            "Castle => Theatre (Front) -> Castle By Scythe Corridor":
+                Slide
+                | Kicks(3),
+            "Castle => Theatre (Front) -> Castle Moon Room":
+                Slide,
+            "Library Main -> Library Top":
+                Plunge
+                | Slide,
+            "Library Greaves -> Library Top":
+                Slide,
+            "Library Top -> Library Greaves":
+                Kicks(2),
+            "Keep Main -> Keep => Underbelly":
+                Slide,
+            "Keep Main -> Theatre Outside Scythe Corridor":
+                Slide,
+            "Underbelly => Dungeon -> Underbelly Ascendant Light":
+                Breaker
+                | Kicks(1) & Slide,
+            "Underbelly Light Pillar -> Underbelly => Dungeon":
+                Slide & KickOrPlunge(2),
+            "Underbelly Light Pillar -> Underbelly Ascendant Light":
+                Breaker
+                & (
+                    Kicks(2)
+                    | Kicks(1) & Gem
+                    | Slide)
+                | Plunge
+                & (
+                    Gem
+                    | Kicks(1)
+                    | Slide),
+            "Underbelly Ascendant Light -> Underbelly => Dungeon":
+                Slide & Kicks(1),
+            "Underbelly Main Lower -> Underbelly Hole":
+                Plunge & Slide,
+            "Underbelly Main Lower -> Underbelly By Heliacal":
+                Slide,
+            "Underbelly Main Lower -> Underbelly Main Upper":
+                Gem & KickOrPlunge(1)
+                | Kicks(4)
+                | Slide
+                & (
+                    Gem
+                    | Kicks(3)
+                    | Kicks(1) & Plunge
+                    | Kicks(1) & Breaker),
+            "Underbelly Main Upper -> Underbelly Light Pillar":
+                Breaker & Slide
+                | Slide & Kicks(1)
+                | Plunge & Kicks(2)
+                | Gem & Kicks(2),
+            "Underbelly Main Upper -> Underbelly By Heliacal":
+                Breaker & Slide & Kicks(2),
+            "Underbelly By Heliacal -> Underbelly Main Upper":
+                Plunge
+                | Breaker
+                & (
+                    Slide
+                    | Gem
+                    | Kicks(1))
+                | Slide
+                & (
+                    Gem
+                    | Kicks(2)),
+            "Underbelly Hole -> Underbelly Main Lower":
+                Slide,
         }
 
         location_clauses = {
-            "Dilapidated Dungeon - Dark Orbs": lambda state:
-                self.has_slide(state) and self.get_kicks(state, 1)
-                or self.has_slide(state) and self.can_bounce(state),
-            "Dilapidated Dungeon - Rafters": lambda state:
-                self.kick_or_plunge(state, 2)
-                or self.can_bounce(state) and self.get_kicks(state, 1)
-                or self.has_slide(state) and self.kick_or_plunge(state, 1),
-            "Dilapidated Dungeon - Strong Eyes": lambda state:
-                self.has_gem(state)
-                or self.has_slide(state) and self.get_kicks(state, 1),
-            "Castle Sansa - Floater In Courtyard": lambda state:
-                self.can_bounce(state)
-                and (
-                    self.kick_or_plunge(state, 1)
-                    or self.has_slide(state))
-                or self.has_slide(state) and self.get_kicks(state, 1)
-                or self.get_kicks(state, 3)
-                or self.has_gem(state),
-            "Castle Sansa - Platform In Main Halls": lambda state:
-                self.has_slide(state),
-            "Castle Sansa - Tall Room Near Wheel Crawlers": lambda state:
-                self.has_slide(state),
-            "Castle Sansa - Alcove Near Dungeon": lambda state:
-                self.kick_or_plunge(state, 1)
-                or self.has_slide(state),
-            "Castle Sansa - Balcony": lambda state:
-                self.get_kicks(state, 3)
-                or self.has_plunge(state) and self.get_kicks(state, 1)
-                or self.has_slide(state),
-            "Castle Sansa - Corner Corridor": lambda state:
-                self.get_kicks(state, 2) and self.has_slide(state),
-            "Castle Sansa - Wheel Crawlers": lambda state:
-                self.kick_or_plunge(state, 1)
-                or self.has_slide(state),
-            "Castle Sansa - Alcove Near Scythe Corridor": lambda state:
-                self.kick_or_plunge(state, 3)
-                or self.has_slide(state) and self.kick_or_plunge(state, 1),
-            "Castle Sansa - Near Theatre Front": lambda state:
-                self.has_slide(state),
-            "Castle Sansa - High Climb From Courtyard": lambda state:
-                self.can_attack(state) and self.get_kicks(state, 1)
-                or self.has_slide(state),
-            "Listless Library - Upper Back": lambda state:
-                self.can_attack(state) and self.has_slide(state),
-            "Listless Library - Locked Door Across": lambda state:
-                self.has_slide(state),
-            "Listless Library - Locked Door Left": lambda state:
-                self.kick_or_plunge(state, 2)
-                or self.has_slide(state) and self.kick_or_plunge(state, 1),
-            "Sansa Keep - Strikebreak": lambda state:
-                self.has_breaker(state) and self.has_slide(state)
-                or self.can_strikebreak(state) and self.has_plunge(state),
-            "Sansa Keep - Lonely Throne": lambda state:
-                self.has_breaker(state)
-                and (
-                    self.has_gem(state)
-                    or self.can_bounce(state) and self.kick_or_plunge(state, 3)
-                    or self.has_slide(state) and self.get_kicks(state, 3)),
-            "Sansa Keep - Near Theatre": lambda state:
-                self.has_slide(state),
-            "The Underbelly - Rafters Near Keep": lambda state:
-                self.has_slide(state),
-            "The Underbelly - Main Room": lambda state:
-                self.has_slide(state) or self.get_kicks(state, 1),
-            "The Underbelly - Alcove Near Light": lambda state:
-                self.get_kicks(state, 1) and self.has_slide(state),
-            "The Underbelly - Building Near Little Guy": lambda state:
-                self.get_kicks(state, 1)
-                or self.has_slide(state),
-            "The Underbelly - Strikebreak Wall": lambda state:
-                self.can_strikebreak(state)
-                and (
-                    self.has_slide(state) and self.kick_or_plunge(state, 1)
-                    or self.has_slide(state) and self.has_gem(state)),
-            "The Underbelly - Surrounded By Holes": lambda state:
-                self.can_soulcutter(state) and self.has_slide(state)
-                or self.has_slide(state) and self.get_kicks(state, 1),
+            "Dilapidated Dungeon - Dark Orbs":
+                Slide & Kicks(1)
+                | Slide & Bounce,
+            "Dilapidated Dungeon - Rafters":
+                KickOrPlunge(2)
+                | Bounce & Kicks(1)
+                | Slide & KickOrPlunge(1),
+            "Dilapidated Dungeon - Strong Eyes":
+                Gem
+                | Slide & Kicks(1),
+            "Castle Sansa - Floater In Courtyard":
+                Bounce
+                & (
+                    KickOrPlunge(1)
+                    | Slide)
+                | Slide & Kicks(1)
+                | Kicks(3)
+                | Gem,
+            "Castle Sansa - Platform In Main Halls":
+                Slide,
+            "Castle Sansa - Tall Room Near Wheel Crawlers":
+                Slide,
+            "Castle Sansa - Alcove Near Dungeon":
+                KickOrPlunge(1)
+                | Slide,
+            "Castle Sansa - Balcony":
+                Kicks(3)
+                | Plunge & Kicks(1)
+                | Slide,
+            "Castle Sansa - Corner Corridor":
+                Kicks(2) & Slide,
+            "Castle Sansa - Wheel Crawlers":
+                KickOrPlunge(1)
+                | Slide,
+            "Castle Sansa - Alcove Near Scythe Corridor":
+                KickOrPlunge(3)
+                | Slide & KickOrPlunge(1),
+            "Castle Sansa - Near Theatre Front":
+                Slide,
+            "Castle Sansa - High Climb From Courtyard":
+                Attack & Kicks(1)
+                | Slide,
+            "Listless Library - Upper Back":
+                Attack & Slide,
+            "Listless Library - Locked Door Across":
+                Slide,
+            "Listless Library - Locked Door Left":
+                KickOrPlunge(2)
+                | Slide & KickOrPlunge(1),
+            "Sansa Keep - Strikebreak":
+                Breaker & Slide
+                | Strikebreak & Plunge,
+            "Sansa Keep - Lonely Throne":
+                Breaker
+                & (
+                    Gem
+                    | Bounce & KickOrPlunge(3)
+                    | Slide & Kicks(3)),
+            "Sansa Keep - Near Theatre":
+                Slide,
+            "The Underbelly - Rafters Near Keep":
+                Slide,
+            "The Underbelly - Main Room":
+                Slide | Kicks(1),
+            "The Underbelly - Alcove Near Light":
+                Kicks(1) & Slide,
+            "The Underbelly - Building Near Little Guy":
+                Kicks(1)
+                | Slide,
+            "The Underbelly - Strikebreak Wall":
+                Strikebreak
+                & (
+                    Slide & KickOrPlunge(1)
+                    | Slide & Gem),
+            "The Underbelly - Surrounded By Holes":
+                SoulCutter & Slide
+                | Slide & Kicks(1),
         }
 
         self.apply_clauses(region_clauses, location_clauses)
-
-    def set_pseudoregalia_rules(self) -> None:
-        super().set_pseudoregalia_rules()
@@ -1,4 +1,6 @@
 from .rules_normal import PseudoregaliaNormalRules
+from .logic import (TRUE, Breaker, Strikebreak, SoulCutter, Slide, SlideJump, Plunge, Gem, Bounce, Attack, Obscure,
+                    Kicks, KickOrPlunge)
 
 
 class PseudoregaliaHardRules(PseudoregaliaNormalRules):
@@ -6,163 +8,160 @@ class PseudoregaliaHardRules(PseudoregaliaNormalRules):
         super().__init__(world)
 
         region_clauses = {
-            "Dungeon Escape Lower -> Dungeon Escape Upper": lambda state:
-                self.has_gem(state)
-                or self.kick_or_plunge(state, 2),
-            "Castle Main -> Theatre Pillar": lambda state:
-                self.has_gem(state)
-                or self.kick_or_plunge(state, 1),
-            "Castle Main -> Castle Spiral Climb": lambda state:
-                self.has_gem(state)
-                or self.kick_or_plunge(state, 2)
-                or self.can_slidejump(state) and self.has_plunge(state),
-            "Castle Spiral Climb -> Castle High Climb": lambda state:
-                self.kick_or_plunge(state, 3)
-                or self.knows_obscure(state) and self.can_attack(state) and self.can_slidejump(state),
-            "Castle By Scythe Corridor -> Castle Spiral Climb": lambda state:
-                self.get_kicks(state, 3),
-            "Castle By Scythe Corridor -> Castle => Theatre (Front)": lambda state:
-                self.has_gem(state),
-            "Castle By Scythe Corridor -> Castle High Climb": lambda state:
-                self.get_kicks(state, 3) and self.has_breaker(state)
-                or self.get_kicks(state, 1) and self.has_plunge(state),
-            "Castle => Theatre (Front) -> Castle Moon Room": lambda state:
-                self.get_kicks(state, 4),
-            "Library Main -> Library Top": lambda state:
-                self.has_gem(state)
-                or self.knows_obscure(state) and self.kick_or_plunge(state, 2),
-            "Library Greaves -> Library Top": lambda state:
-                self.get_kicks(state, 1),
-            "Library Top -> Library Greaves": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 3)
-                or self.get_kicks(state, 2) and self.has_plunge(state) and self.can_bounce(state),
-            "Keep Main -> Keep Locked Room": lambda state: True,
+            "Dungeon Escape Lower -> Dungeon Escape Upper":
+                Gem
+                | KickOrPlunge(2),
+            "Castle Main -> Theatre Pillar":
+                Gem
+                | KickOrPlunge(1),
+            "Castle Main -> Castle Spiral Climb":
+                Gem
+                | KickOrPlunge(2)
+                | SlideJump & Plunge,
+            "Castle Spiral Climb -> Castle High Climb":
+                KickOrPlunge(3)
+                | Obscure & Attack & SlideJump,
+            "Castle By Scythe Corridor -> Castle Spiral Climb":
+                Kicks(3),
+            "Castle By Scythe Corridor -> Castle => Theatre (Front)":
+                Gem,
+            "Castle By Scythe Corridor -> Castle High Climb":
+                Kicks(3) & Breaker
+                | Kicks(1) & Plunge,
+            "Castle => Theatre (Front) -> Castle Moon Room":
+                Kicks(4),
+            "Library Main -> Library Top":
+                Gem
+                | Obscure & KickOrPlunge(2),
+            "Library Greaves -> Library Top":
+                Kicks(1),
+            "Library Top -> Library Greaves":
+                Gem
+                | Kicks(3)
+                | Kicks(2) & Plunge & Bounce,
+            "Keep Main -> Keep Locked Room": TRUE,
                 # Note for trackers: This is accessible with nothing but not in logic.
                 # Cutting the platform or hitting the lever make this harder and are irreversible.
                 # On Hard and above, the player is expected to not do either.
-            "Keep Main -> Keep Sunsetter": lambda state: True,
+            "Keep Main -> Keep Sunsetter": TRUE,
                 # See "Keep Main -> Keep Locked Room".
-            "Underbelly => Dungeon -> Underbelly Ascendant Light": lambda state:
-                self.kick_or_plunge(state, 2),
-            "Underbelly Light Pillar -> Underbelly => Dungeon": lambda state:
-                self.has_plunge(state) and self.get_kicks(state, 2),
-            "Underbelly Light Pillar -> Underbelly Ascendant Light": lambda state:
-                self.has_breaker(state)
-                and self.get_kicks(state, 3)
-                or self.knows_obscure(state) and self.has_plunge(state)
-                and (
-                    self.has_gem(state)
-                    or self.get_kicks(state, 1)
-                    or self.can_slidejump(state)),
-            "Underbelly Ascendant Light -> Underbelly => Dungeon": lambda state:
-                self.kick_or_plunge(state, 2),
-            "Underbelly Main Lower -> Underbelly Hole": lambda state:
-                self.has_plunge(state) and self.has_gem(state),
-            "Underbelly Main Lower -> Underbelly By Heliacal": lambda state:
-                self.has_slide(state) and self.knows_obscure(state) and self.get_kicks(state, 2),
-            "Underbelly Main Lower -> Underbelly Main Upper": lambda state:
-                self.knows_obscure(state) and self.has_gem(state) and self.get_kicks(state, 1),
-            "Underbelly Main Upper -> Underbelly Light Pillar": lambda state:
-                self.has_gem(state)
-                and (
-                    self.has_plunge(state)
-                    or self.get_kicks(state, 3)),
-            "Underbelly Main Upper -> Underbelly By Heliacal": lambda state:
-                self.has_breaker(state)
-                and (
-                    self.has_gem(state)
-                    or self.has_plunge(state) and self.get_kicks(state, 3)
-                    or self.can_slidejump(state) and self.get_kicks(state, 3)),
-            "Underbelly Little Guy -> Underbelly Main Lower": lambda state: True,
-            "Underbelly Hole -> Underbelly Main Lower": lambda state:
-                self.get_kicks(state, 1)
-                or self.has_gem(state),
+            "Underbelly => Dungeon -> Underbelly Ascendant Light":
+                KickOrPlunge(2),
+            "Underbelly Light Pillar -> Underbelly => Dungeon":
+                Plunge & Kicks(2),
+            "Underbelly Light Pillar -> Underbelly Ascendant Light":
+                Breaker
+                & Kicks(3)
+                | Obscure & Plunge
+                & (
+                    Gem
+                    | Kicks(1)
+                    | SlideJump),
+            "Underbelly Ascendant Light -> Underbelly => Dungeon":
+                KickOrPlunge(2),
+            "Underbelly Main Lower -> Underbelly Hole":
+                Plunge & Gem,
+            "Underbelly Main Lower -> Underbelly By Heliacal":
+                Slide & Obscure & Kicks(2),
+            "Underbelly Main Lower -> Underbelly Main Upper":
+                Obscure & Gem & Kicks(1),
+            "Underbelly Main Upper -> Underbelly Light Pillar":
+                Gem
+                & (
+                    Plunge
+                    | Kicks(3)),
+            "Underbelly Main Upper -> Underbelly By Heliacal":
+                Breaker
+                & (
+                    Gem
+                    | Plunge & Kicks(3)
+                    | SlideJump & Kicks(3)),
+            "Underbelly Little Guy -> Underbelly Main Lower": TRUE,
+            "Underbelly Hole -> Underbelly Main Lower":
+                Kicks(1)
+                | Gem,
         }
 
         location_clauses = {
-            "Dilapidated Dungeon - Dark Orbs": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 1) and self.can_bounce(state)
-                or self.can_slidejump(state) and self.has_plunge(state) and self.can_bounce(state)
-                or self.get_kicks(state, 3) and self.has_plunge(state),
-            "Dilapidated Dungeon - Past Poles": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 2),
-            "Dilapidated Dungeon - Rafters": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 1) and self.has_plunge(state)
-                or self.get_kicks(state, 1) and self.can_bounce(state),
-            "Dilapidated Dungeon - Strong Eyes": lambda state:
-                self.knows_obscure(state) and self.has_gem(state) and self.kick_or_plunge(state, 2),
-            "Castle Sansa - Floater In Courtyard": lambda state:
-                self.kick_or_plunge(state, 4)
-                or self.has_gem(state),
-            "Castle Sansa - Platform In Main Halls": lambda state:
-                self.kick_or_plunge(state, 1),
-            "Castle Sansa - Tall Room Near Wheel Crawlers": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 1)
-                or self.knows_obscure(state) and self.can_slidejump(state) and self.has_plunge(state),
-            "Castle Sansa - Alcove Near Dungeon": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 1)
-                or self.knows_obscure(state) and self.has_plunge(state),
-            "Castle Sansa - Balcony": lambda state:
-                self.can_slidejump(state) and self.get_kicks(state, 1),
-            "Castle Sansa - Corner Corridor": lambda state:
-                self.get_kicks(state, 3),
-            "Castle Sansa - Wheel Crawlers": lambda state:
-                self.get_kicks(state, 1)
-                or self.can_slidejump(state) and self.has_plunge(state),
-            "Castle Sansa - Alcove Near Scythe Corridor": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 2) and self.has_plunge(state),
-            "Castle Sansa - Near Theatre Front": lambda state:
-                self.has_gem(state),
-            "Castle Sansa - High Climb From Courtyard": lambda state:
-                self.has_gem(state)
-                or self.has_plunge(state) and self.can_slidejump(state),
-            "Listless Library - Upper Back": lambda state:
-                self.can_attack(state) and self.has_gem(state),
-            "Listless Library - Locked Door Across": lambda state:
-                self.kick_or_plunge(state, 1),
-            "Listless Library - Locked Door Left": lambda state:
-                self.get_kicks(state, 2),
-            "Sansa Keep - Strikebreak": lambda state:
-                self.has_breaker(state) and self.get_kicks(state, 1)
-                and (
-                    self.has_slide(state)
-                    or self.can_strikebreak(state)),
-            "Sansa Keep - Lonely Throne": lambda state:
-                self.has_breaker(state) and self.has_gem(state)
-                and (
-                    self.has_plunge(state)
-                    or self.get_kicks(state, 2)
-                    or self.get_kicks(state, 1) and self.knows_obscure(state))
-                or self.has_breaker(state) and self.has_plunge(state) and self.get_kicks(state, 4)
-                or self.can_bounce(state) and self.get_kicks(state, 3),
-            "The Underbelly - Rafters Near Keep": lambda state:
-                self.kick_or_plunge(state, 1)
-                or self.has_gem(state),
-            "The Underbelly - Main Room": lambda state:
-                self.can_slidejump(state),
-            "The Underbelly - Alcove Near Light": lambda state:
-                self.get_kicks(state, 3)
-                or self.get_kicks(state, 2) and self.can_slidejump(state),
-            "The Underbelly - Building Near Little Guy": lambda state:
-                self.get_kicks(state, 2),
-            "The Underbelly - Strikebreak Wall": lambda state:
-                self.can_strikebreak(state)
-                and (
-                    self.get_kicks(state, 3)
-                    or self.get_kicks(state, 1) and self.has_plunge(state)),
-            "The Underbelly - Surrounded By Holes": lambda state:
-                self.can_soulcutter(state) and self.get_kicks(state, 1)
-                or self.has_gem(state),
+            "Dilapidated Dungeon - Dark Orbs":
+                Gem
+                | Kicks(1) & Bounce
+                | SlideJump & Plunge & Bounce
+                | Kicks(3) & Plunge,
+            "Dilapidated Dungeon - Past Poles":
+                Gem
+                | Kicks(2),
+            "Dilapidated Dungeon - Rafters":
+                Gem
+                | Kicks(1) & Plunge
+                | Kicks(1) & Bounce,
+            "Dilapidated Dungeon - Strong Eyes":
+                Obscure & Gem & KickOrPlunge(2),
+            "Castle Sansa - Floater In Courtyard":
+                KickOrPlunge(4)
+                | Gem,
+            "Castle Sansa - Platform In Main Halls":
+                KickOrPlunge(1),
+            "Castle Sansa - Tall Room Near Wheel Crawlers":
+                Gem
+                | Kicks(1)
+                | Obscure & SlideJump & Plunge,
+            "Castle Sansa - Alcove Near Dungeon":
+                Gem
+                | Kicks(1)
+                | Obscure & Plunge,
+            "Castle Sansa - Balcony":
+                SlideJump & Kicks(1),
+            "Castle Sansa - Corner Corridor":
+                Kicks(3),
+            "Castle Sansa - Wheel Crawlers":
+                Kicks(1)
+                | SlideJump & Plunge,
+            "Castle Sansa - Alcove Near Scythe Corridor":
+                Gem
+                | Kicks(2) & Plunge,
+            "Castle Sansa - Near Theatre Front":
+                Gem,
+            "Castle Sansa - High Climb From Courtyard":
+                Gem
+                | Plunge & SlideJump,
+            "Listless Library - Upper Back":
+                Attack & Gem,
+            "Listless Library - Locked Door Across":
+                KickOrPlunge(1),
+            "Listless Library - Locked Door Left":
+                Kicks(2),
+            "Sansa Keep - Strikebreak":
+                Breaker & Kicks(1)
+                & (
+                    Slide
+                    | Strikebreak),
+            "Sansa Keep - Lonely Throne":
+                Breaker & Gem
+                & (
+                    Plunge
+                    | Kicks(2)
+                    | Kicks(1) & Obscure)
+                | Breaker & Plunge & Kicks(4)
+                | Bounce & Kicks(3),
+            "The Underbelly - Rafters Near Keep":
+                KickOrPlunge(1)
+                | Gem,
+            "The Underbelly - Main Room":
+                SlideJump,
+            "The Underbelly - Alcove Near Light":
+                Kicks(3)
+                | Kicks(2) & SlideJump,
+            "The Underbelly - Building Near Little Guy":
+                Kicks(2),
+            "The Underbelly - Strikebreak Wall":
+                Strikebreak
+                & (
+                    Kicks(3)
+                    | Kicks(1) & Plunge),
+            "The Underbelly - Surrounded By Holes":
+                SoulCutter & Kicks(1)
+                | Gem,
         }
 
         self.apply_clauses(region_clauses, location_clauses)
-
-    def set_pseudoregalia_rules(self) -> None:
-        super().set_pseudoregalia_rules()
@@ -1,4 +1,5 @@
 from .rules_expert import PseudoregaliaExpertRules
+from .logic import TRUE, Breaker, SoulCutter, Slide, Plunge, Gem, Bounce, Kicks, KickOrPlunge
 
 
 class PseudoregaliaLunaticRules(PseudoregaliaExpertRules):
@@ -6,53 +7,50 @@ class PseudoregaliaLunaticRules(PseudoregaliaExpertRules):
         super().__init__(world)
 
         region_clauses = {
-            "Dungeon Escape Lower -> Dungeon Escape Upper": lambda state:
-                self.has_slide(state) and self.kick_or_plunge(state, 1),
-            "Castle Spiral Climb -> Castle By Scythe Corridor": lambda state:
-                self.get_kicks(state, 3),
-            "Castle By Scythe Corridor -> Castle => Theatre (Front)": lambda state:
-                self.has_slide(state) and self.kick_or_plunge(state, 2),
-            "Library Main -> Library Top": lambda state:
-                self.get_kicks(state, 1),
-            "Library Top -> Library Greaves": lambda state:
-                self.can_bounce(state) and self.get_kicks(state, 1) and self.has_plunge(state),
-            "Underbelly Main Lower -> Underbelly Main Upper": lambda state:
-                self.has_slide(state)
-                and (
-                    self.has_gem(state)
-                    or self.get_kicks(state, 2)
-                    or self.get_kicks(state, 1) and self.has_plunge(state)
-                    or self.get_kicks(state, 1) and self.has_breaker(state)),
+            "Dungeon Escape Lower -> Dungeon Escape Upper":
+                Slide & KickOrPlunge(1),
+            "Castle Spiral Climb -> Castle By Scythe Corridor":
+                Kicks(3),
+            "Castle By Scythe Corridor -> Castle => Theatre (Front)":
+                Slide & KickOrPlunge(2),
+            "Library Main -> Library Top":
+                Kicks(1),
+            "Library Top -> Library Greaves":
+                Bounce & Kicks(1) & Plunge,
+            "Underbelly Main Lower -> Underbelly Main Upper":
+                Slide
+                & (
+                    Gem
+                    | Kicks(2)
+                    | Kicks(1) & Plunge
+                    | Kicks(1) & Breaker),
         }
 
         location_clauses = {
-            "Dilapidated Dungeon - Past Poles": lambda state:
-                self.has_slide(state) and self.get_kicks(state, 1) and self.has_plunge(state),
-            "Dilapidated Dungeon - Rafters": lambda state:
-                self.can_bounce(state) and self.kick_or_plunge(state, 1)
-                or self.has_slide(state),
-            "Dilapidated Dungeon - Strong Eyes": lambda state:
-                self.has_slide(state) and self.kick_or_plunge(state, 1),
-            "Castle Sansa - Platform In Main Halls": lambda state:
-                self.can_bounce(state),
-            "Castle Sansa - Corner Corridor": lambda state:
-                self.get_kicks(state, 1) and self.has_slide(state),
-            "Castle Sansa - Alcove Near Scythe Corridor": lambda state:
-                self.kick_or_plunge(state, 1),  # This never really matters and that makes me sad
-            "Sansa Keep - Levers Room": lambda state: True,
-            "Sansa Keep - Lonely Throne": lambda state:
-                self.has_breaker(state) and self.has_slide(state) and self.kick_or_plunge(state, 3)
-                or (
-                    self.has_slide(state)
-                    and self.can_bounce(state)
-                    and self.get_kicks(state, 1)
-                    and self.has_plunge(state)
-                    and self.can_soulcutter(state)),
-            "Listless Library - Upper Back": lambda state:
-                self.has_plunge(state),
+            "Dilapidated Dungeon - Past Poles":
+                Slide & Kicks(1) & Plunge,
+            "Dilapidated Dungeon - Rafters":
+                Bounce & KickOrPlunge(1)
+                | Slide,
+            "Dilapidated Dungeon - Strong Eyes":
+                Slide & KickOrPlunge(1),
+            "Castle Sansa - Platform In Main Halls":
+                Bounce,
+            "Castle Sansa - Corner Corridor":
+                Kicks(1) & Slide,
+            "Castle Sansa - Alcove Near Scythe Corridor":
+                KickOrPlunge(1),  # This never really matters and that makes me sad
+            "Sansa Keep - Levers Room": TRUE,
+            "Sansa Keep - Lonely Throne":
+                Breaker & Slide & KickOrPlunge(3)
+                | (
+                    Slide
+                    & Bounce
+                    & Kicks(1)
+                    & Plunge
+                    & SoulCutter),
+            "Listless Library - Upper Back":
+                Plunge,
         }
 
         self.apply_clauses(region_clauses, location_clauses)
-
-    def set_pseudoregalia_rules(self) -> None:
-        super().set_pseudoregalia_rules()
@@ -1,4 +1,6 @@
 from .rules import PseudoregaliaRulesHelpers
+from .logic import (Breaker, Strikebreak, SoulCutter, Slide, SlideJump, Plunge, Gem, Light, Bounce, Attack,
+                    NavigateDarkrooms, Obscure, SmallKeys, Kicks, KickOrPlunge)
 
 
 class PseudoregaliaNormalRules(PseudoregaliaRulesHelpers):
@@ -6,329 +8,326 @@ class PseudoregaliaNormalRules(PseudoregaliaRulesHelpers):
         super().__init__(world)
 
         region_clauses = {
-            "Dungeon Mirror -> Dungeon Slide": lambda state:
-                self.can_attack(state),
-            "Dungeon Slide -> Dungeon Mirror": lambda state:
-                self.can_attack(state),
-            "Dungeon Slide -> Dungeon Strong Eyes": lambda state:
-                self.has_slide(state),
-            "Dungeon Slide -> Dungeon Escape Lower": lambda state:
-                self.can_attack(state) and self.navigate_darkrooms(state),
-            "Dungeon Strong Eyes -> Dungeon Slide": lambda state:
-                self.has_slide(state),
-            "Dungeon Strong Eyes -> Dungeon => Castle": lambda state:
-                self.has_small_keys(state),
-            # "Dungeon => Castle -> Dungeon Mirror": lambda state: True,
-            "Dungeon => Castle -> Dungeon Strong Eyes": lambda state:
-                self.has_small_keys(state),
-            # "Dungeon => Castle -> Castle Main": lambda state: True,
-            "Dungeon Escape Lower -> Dungeon Slide": lambda state:
-                self.can_attack(state),
-            "Dungeon Escape Lower -> Dungeon Escape Upper": lambda state:
-                self.can_bounce(state)
-                or self.get_kicks(state, 1) and self.has_plunge(state)
-                or self.get_kicks(state, 3),
-            # "Dungeon Escape Lower -> Underbelly => Dungeon": lambda state: True,
-            "Dungeon Escape Upper -> Theatre Outside Scythe Corridor": lambda state:
-                self.can_bounce(state)
-                or self.kick_or_plunge(state, 1)
-                or self.has_gem(state),
-            # "Dungeon Escape Upper -> Theatre Outside Scythe Corridor": lambda state: True,
-            # "Castle Main -> Dungeon => Castle": lambda state: True,
-            # "Castle Main -> Keep Main": lambda state: True,
-            # "Castle Main -> Empty Bailey": lambda state: True,
-            "Castle Main -> Library Main": lambda state:
-                self.can_attack(state),
-            "Castle Main -> Theatre Pillar": lambda state:
-                self.has_gem(state) and self.kick_or_plunge(state, 1)
-                or self.kick_or_plunge(state, 2),
-            "Castle Main -> Castle Spiral Climb": lambda state:
-                self.get_kicks(state, 2)
-                or self.has_gem(state) and self.has_plunge(state),
-            # "Castle Spiral Climb -> Castle Main": lambda state: True,
-            "Castle Spiral Climb -> Castle High Climb": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 3) and self.has_plunge(state)
-                or self.can_attack(state) and self.get_kicks(state, 1),
-            "Castle Spiral Climb -> Castle By Scythe Corridor": lambda state:
-                self.has_gem(state),
-            "Castle By Scythe Corridor -> Castle Spiral Climb": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 4) and self.has_plunge(state),
-            "Castle By Scythe Corridor -> Castle High Climb": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 4)
-                or self.get_kicks(state, 2) and self.has_plunge(state)
-                or self.get_kicks(state, 1) and self.has_plunge(state) and self.can_slidejump(state),
-            "Castle By Scythe Corridor -> Castle => Theatre (Front)": lambda state:
-                self.has_gem(state) and self.kick_or_plunge(state, 2),
-            "Castle => Theatre (Front) -> Castle By Scythe Corridor": lambda state:
-                self.has_gem(state)
-                or self.can_slidejump(state) and self.get_kicks(state, 1)
-                or self.get_kicks(state, 4),
-            "Castle => Theatre (Front) -> Castle Moon Room": lambda state:
-                self.has_gem(state)
-                or self.can_slidejump(state) and self.kick_or_plunge(state, 2),
-            # "Castle => Theatre (Front) -> Theatre Main": lambda state: True,
-            "Library Main -> Library Locked": lambda state:
-                self.has_small_keys(state),
-            "Library Main -> Library Greaves": lambda state:
-                self.has_slide(state),
-            "Library Main -> Library Top": lambda state:
-                self.kick_or_plunge(state, 4)
-                or self.knows_obscure(state) and self.get_kicks(state, 1) and self.has_plunge(state),
-            "Library Greaves -> Library Top": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 2),
-            "Library Top -> Library Greaves": lambda state:
-                self.has_gem(state) and self.kick_or_plunge(state, 1)
-                or self.get_kicks(state, 3) and self.has_plunge(state)
-                or self.get_kicks(state, 3) and self.can_bounce(state),
-            "Keep Main -> Keep Locked Room": lambda state:
+            "Dungeon Mirror -> Dungeon Slide":
+                Attack,
+            "Dungeon Slide -> Dungeon Mirror":
+                Attack,
+            "Dungeon Slide -> Dungeon Strong Eyes":
+                Slide,
+            "Dungeon Slide -> Dungeon Escape Lower":
+                Attack & NavigateDarkrooms,
+            "Dungeon Strong Eyes -> Dungeon Slide":
+                Slide,
+            "Dungeon Strong Eyes -> Dungeon => Castle":
+                SmallKeys,
+            # "Dungeon => Castle -> Dungeon Mirror": True,
+            "Dungeon => Castle -> Dungeon Strong Eyes":
+                SmallKeys,
+            # "Dungeon => Castle -> Castle Main": True,
+            "Dungeon Escape Lower -> Dungeon Slide":
+                Attack,
+            "Dungeon Escape Lower -> Dungeon Escape Upper":
+                Bounce
+                | Kicks(1) & Plunge
+                | Kicks(3),
+            # "Dungeon Escape Lower -> Underbelly => Dungeon": True,
+            "Dungeon Escape Upper -> Theatre Outside Scythe Corridor":
+                Bounce
+                | KickOrPlunge(1)
+                | Gem,
+            # "Dungeon Escape Upper -> Theatre Outside Scythe Corridor": True,
+            # "Castle Main -> Dungeon => Castle": True,
+            # "Castle Main -> Keep Main": True,
+            # "Castle Main -> Empty Bailey": True,
+            "Castle Main -> Library Main":
+                Attack,
+            "Castle Main -> Theatre Pillar":
+                Gem & KickOrPlunge(1)
+                | KickOrPlunge(2),
+            "Castle Main -> Castle Spiral Climb":
+                Kicks(2)
+                | Gem & Plunge,
+            # "Castle Spiral Climb -> Castle Main": True,
+            "Castle Spiral Climb -> Castle High Climb":
+                Gem
+                | Kicks(3) & Plunge
+                | Attack & Kicks(1),
+            "Castle Spiral Climb -> Castle By Scythe Corridor":
+                Gem,
+            "Castle By Scythe Corridor -> Castle Spiral Climb":
+                Gem
+                | Kicks(4) & Plunge,
+            "Castle By Scythe Corridor -> Castle High Climb":
+                Gem
+                | Kicks(4)
+                | Kicks(2) & Plunge
+                | Kicks(1) & Plunge & SlideJump,
+            "Castle By Scythe Corridor -> Castle => Theatre (Front)":
+                Gem & KickOrPlunge(2),
+            "Castle => Theatre (Front) -> Castle By Scythe Corridor":
+                Gem
+                | SlideJump & Kicks(1)
+                | Kicks(4),
+            "Castle => Theatre (Front) -> Castle Moon Room":
+                Gem
+                | SlideJump & KickOrPlunge(2),
+            # "Castle => Theatre (Front) -> Theatre Main": True,
+            "Library Main -> Library Locked":
+                SmallKeys,
+            "Library Main -> Library Greaves":
+                Slide,
+            "Library Main -> Library Top":
+                KickOrPlunge(4)
+                | Obscure & Kicks(1) & Plunge,
+            "Library Greaves -> Library Top":
+                Gem
+                | Kicks(2),
+            "Library Top -> Library Greaves":
+                Gem & KickOrPlunge(1)
+                | Kicks(3) & Plunge
+                | Kicks(3) & Bounce,
+            "Keep Main -> Keep Locked Room":
                 # Note for trackers: This is accessible with nothing but not in logic.
                 # Cutting the platform or hitting the lever make this harder and are irreversible.
                 # On Hard and above, the player is expected to not do either.
-                self.has_small_keys(state)
-                or self.get_kicks(state, 3)
-                or self.has_plunge(state) and self.get_kicks(state, 1)
-                or self.has_gem(state) and self.has_plunge(state)
-                or self.has_gem(state) and self.get_kicks(state, 1),
-            "Keep Main -> Keep Sunsetter": lambda state:
+                SmallKeys
+                | Kicks(3)
+                | Plunge & Kicks(1)
+                | Gem & Plunge
+                | Gem & Kicks(1),
+            "Keep Main -> Keep Sunsetter":
                 # See "Keep Main -> Keep Locked Room".
                 # All other methods would go through Keep Locked Room instead.
-                self.has_gem(state),
-            "Keep Main -> Keep => Underbelly": lambda state:
-                self.kick_or_plunge(state, 1)
-                or self.has_gem(state),
-            "Keep Main -> Theatre Outside Scythe Corridor": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 1)
-                or self.can_bounce(state)
-                or self.can_slidejump(state),
-            # "Keep Locked Room -> Keep Sunsetter": lambda state: True,
-            # "Keep => Underbelly -> Keep Main": lambda state: True,
-            # "Keep => Underbelly -> Underbelly => Keep": lambda state: True,
-            "Underbelly => Dungeon -> Dungeon Escape Lower": lambda state:
-                self.navigate_darkrooms(state),
-            # "Underbelly => Dungeon -> Underbelly Light Pillar": lambda state: True,
-            "Underbelly => Dungeon -> Underbelly Ascendant Light": lambda state:
-                self.can_bounce(state)
-                or self.has_gem(state)
-                or self.get_kicks(state, 2)
-                or self.get_kicks(state, 1) and self.can_slidejump(state)
-                or self.knows_obscure(state) and self.can_attack(state),
-            # "Underbelly Light Pillar -> Underbelly Main Upper": lambda state: True,
-            "Underbelly Light Pillar -> Underbelly => Dungeon": lambda state:
-                self.can_bounce(state)
-                or self.kick_or_plunge(state, 4),
-            "Underbelly Light Pillar -> Underbelly Ascendant Light": lambda state:
-                self.has_breaker(state)
-                and (
-                    self.has_plunge(state)
-                    or self.get_kicks(state, 4))
-                or self.knows_obscure(state) and self.has_plunge(state) and self.get_kicks(state, 1),
-            "Underbelly Ascendant Light -> Underbelly Light Pillar": lambda state:
-                self.has_breaker(state),
-            "Underbelly Ascendant Light -> Underbelly => Dungeon": lambda state:
-                self.can_bounce(state)
-                or self.has_gem(state)
-                or self.get_kicks(state, 2)
-                or self.get_kicks(state, 1) and self.can_slidejump(state),
-            # "Underbelly Main Lower -> Underbelly Little Guy": lambda state: True,
-            "Underbelly Main Lower -> Underbelly Hole": lambda state:
-                self.has_plunge(state)
-                and (
-                    self.get_kicks(state, 1)
-                    or self.can_slidejump(state)
-                    or self.can_attack(state)),
-            "Underbelly Main Lower -> Underbelly By Heliacal": lambda state:
-                self.has_slide(state) and self.has_plunge(state),
-            "Underbelly Main Lower -> Underbelly Main Upper": lambda state:
-                self.has_plunge(state)
-                and (
-                    self.get_kicks(state, 2)
-                    or self.get_kicks(state, 1) and self.has_gem(state)),
-            # "Underbelly Main Upper -> Underbelly Main Lower": lambda state: True,
-            "Underbelly Main Upper -> Underbelly Light Pillar": lambda state:
-                self.has_breaker(state) and self.has_plunge(state)
-                or self.has_breaker(state) and self.get_kicks(state, 2)
-                or self.has_gem(state)
-                and (
-                    self.get_kicks(state, 2) and self.has_plunge(state)
-                    or self.get_kicks(state, 4)),
-            "Underbelly Main Upper -> Underbelly By Heliacal": lambda state:
-                self.has_breaker(state)
-                and (
-                    state.has("Ascendant Light", self.player)
-                    or self.can_slidejump(state) and self.get_kicks(state, 3)
-                    or self.has_gem(state) and self.get_kicks(state, 2)),
-            "Underbelly By Heliacal -> Underbelly Main Upper": lambda state:
-                self.has_breaker(state) and self.has_plunge(state)
-                or self.knows_obscure(state) and self.has_plunge(state)
-                and (
-                    self.get_kicks(state, 1)
-                    or self.has_gem(state)),
-            # "Underbelly Little Guy -> Empty Bailey": lambda state: True,
-            "Underbelly Little Guy -> Underbelly Main Lower": lambda state:
-                self.has_gem(state)
-                or self.kick_or_plunge(state, 1),
-            # "Underbelly => Keep -> Keep => Underbelly": lambda state: True,
-            "Underbelly => Keep -> Underbelly Hole": lambda state:
-                self.has_plunge(state),
-            "Underbelly Hole -> Underbelly Main Lower": lambda state:
-                self.get_kicks(state, 2)
-                or self.has_gem(state) and self.can_slidejump(state)
-                or self.can_attack(state),
-            "Underbelly Hole -> Underbelly => Keep": lambda state:
-                self.has_slide(state),
+                Gem,
+            "Keep Main -> Keep => Underbelly":
+                KickOrPlunge(1)
+                | Gem,
+            "Keep Main -> Theatre Outside Scythe Corridor":
+                Gem
+                | Kicks(1)
+                | Bounce
+                | SlideJump,
+            # "Keep Locked Room -> Keep Sunsetter": True,
+            # "Keep => Underbelly -> Keep Main": True,
+            # "Keep => Underbelly -> Underbelly => Keep": True,
+            "Underbelly => Dungeon -> Dungeon Escape Lower":
+                NavigateDarkrooms,
+            # "Underbelly => Dungeon -> Underbelly Light Pillar": True,
+            "Underbelly => Dungeon -> Underbelly Ascendant Light":
+                Bounce
+                | Gem
+                | Kicks(2)
+                | Kicks(1) & SlideJump
+                | Obscure & Attack,
+            # "Underbelly Light Pillar -> Underbelly Main Upper": True,
+            "Underbelly Light Pillar -> Underbelly => Dungeon":
+                Bounce
+                | KickOrPlunge(4),
+            "Underbelly Light Pillar -> Underbelly Ascendant Light":
+                Breaker
+                & (
+                    Plunge
+                    | Kicks(4))
+                | Obscure & Plunge & Kicks(1),
+            "Underbelly Ascendant Light -> Underbelly Light Pillar":
+                Breaker,
+            "Underbelly Ascendant Light -> Underbelly => Dungeon":
+                Bounce
+                | Gem
+                | Kicks(2)
+                | Kicks(1) & SlideJump,
+            # "Underbelly Main Lower -> Underbelly Little Guy": True,
+            "Underbelly Main Lower -> Underbelly Hole":
+                Plunge
+                & (
+                    Kicks(1)
+                    | SlideJump
+                    | Attack),
+            "Underbelly Main Lower -> Underbelly By Heliacal":
+                Slide & Plunge,
+            "Underbelly Main Lower -> Underbelly Main Upper":
+                Plunge
+                & (
+                    Kicks(2)
+                    | Kicks(1) & Gem),
+            # "Underbelly Main Upper -> Underbelly Main Lower": True,
+            "Underbelly Main Upper -> Underbelly Light Pillar":
+                Breaker & Plunge
+                | Breaker & Kicks(2)
+                | Gem
+                & (
+                    Kicks(2) & Plunge
+                    | Kicks(4)),
+            "Underbelly Main Upper -> Underbelly By Heliacal":
+                Breaker
+                & (
+                    Light
+                    | SlideJump & Kicks(3)
+                    | Gem & Kicks(2)),
+            "Underbelly By Heliacal -> Underbelly Main Upper":
+                Breaker & Plunge
+                | Obscure & Plunge
+                & (
+                    Kicks(1)
+                    | Gem),
+            # "Underbelly Little Guy -> Empty Bailey": True,
+            "Underbelly Little Guy -> Underbelly Main Lower":
+                Gem
+                | KickOrPlunge(1),
+            # "Underbelly => Keep -> Keep => Underbelly": True,
+            "Underbelly => Keep -> Underbelly Hole":
+                Plunge,
+            "Underbelly Hole -> Underbelly Main Lower":
+                Kicks(2)
+                | Gem & SlideJump
+                | Attack,
+            "Underbelly Hole -> Underbelly => Keep":
+                Slide,
         }
 
         location_clauses = {
-            # "Dilapidated Dungeon - Dream Breaker": lambda state: True,
-            # "Dilapidated Dungeon - Slide": lambda state: True,
-            # "Dilapidated Dungeon - Alcove Near Mirror": lambda state: True,
-            "Dilapidated Dungeon - Dark Orbs": lambda state:
-                self.has_gem(state) and self.can_bounce(state)
-                or self.has_gem(state) and self.kick_or_plunge(state, 3)
-                or self.get_kicks(state, 2) and self.can_bounce(state)
-                or self.can_slidejump(state) and self.get_kicks(state, 1) and self.can_bounce(state),
-            "Dilapidated Dungeon - Past Poles": lambda state:
-                self.has_gem(state) and self.kick_or_plunge(state, 1)
-                or self.get_kicks(state, 3),
-            "Dilapidated Dungeon - Rafters": lambda state:
-                self.kick_or_plunge(state, 3)
-                or self.knows_obscure(state) and self.can_bounce(state) and self.has_gem(state),
-            "Dilapidated Dungeon - Strong Eyes": lambda state:
-                self.has_breaker(state)
-                or self.knows_obscure(state)
-                and (
-                    self.has_gem(state) and self.get_kicks(state, 1) and self.has_plunge(state)
-                    or self.has_gem(state) and self.get_kicks(state, 3)),
-            # "Castle Sansa - Indignation": lambda state: True,
-            "Castle Sansa - Alcove Near Dungeon": lambda state:
-                self.has_gem(state) and self.kick_or_plunge(state, 1)
-                or self.kick_or_plunge(state, 2),
-            "Castle Sansa - Balcony": lambda state:
-                self.has_gem(state)
-                or self.kick_or_plunge(state, 3)
-                or self.can_slidejump(state) and self.kick_or_plunge(state, 2),
-            "Castle Sansa - Corner Corridor": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 4),
-            "Castle Sansa - Floater In Courtyard": lambda state:
-                self.can_bounce(state) and self.has_plunge(state)
-                or self.can_bounce(state) and self.get_kicks(state, 2)
-                or self.has_gem(state) and self.get_kicks(state, 2)
-                or self.has_gem(state) and self.has_plunge(state)
-                or self.get_kicks(state, 4)
-                or self.knows_obscure(state) and self.can_bounce(state) and self.get_kicks(state, 1)
-                or self.knows_obscure(state) and self.has_gem(state) and self.get_kicks(state, 1),
-            "Castle Sansa - Locked Door": lambda state:
-                self.has_small_keys(state),
-            "Castle Sansa - Platform In Main Halls": lambda state:
-                self.has_plunge(state)
-                or self.has_gem(state)
-                or self.get_kicks(state, 2),
-            "Castle Sansa - Tall Room Near Wheel Crawlers": lambda state:
-                self.has_gem(state) and self.kick_or_plunge(state, 1)
-                or self.get_kicks(state, 2),
-            "Castle Sansa - Wheel Crawlers": lambda state:
-                self.can_bounce(state)
-                or self.has_gem(state)
-                or self.get_kicks(state, 2)
-                or self.get_kicks(state, 1) and self.can_slidejump(state)
-                or self.knows_obscure(state) and self.has_plunge(state),
-            "Castle Sansa - High Climb From Courtyard": lambda state:
-                self.get_kicks(state, 2)
-                or self.has_gem(state) and self.has_plunge(state)
-                or self.has_breaker(state) and self.get_kicks(state, 1)
-                or self.knows_obscure(state) and self.has_plunge(state) and self.get_kicks(state, 1),
-            "Castle Sansa - Alcove Near Scythe Corridor": lambda state:
-                self.has_gem(state) and self.get_kicks(state, 1) and self.has_plunge(state)
-                or self.kick_or_plunge(state, 4),
-            "Castle Sansa - Near Theatre Front": lambda state:
-                self.get_kicks(state, 4)
-                or self.get_kicks(state, 2) and self.has_plunge(state),
-            "Listless Library - Sun Greaves": lambda state:
-                self.can_attack(state),
-            "Listless Library - Sun Greaves 1": lambda state:
-                self.can_attack(state),
-            "Listless Library - Sun Greaves 2": lambda state:
-                self.can_attack(state),
-            "Listless Library - Sun Greaves 3": lambda state:
-                self.can_attack(state),
-            "Listless Library - Upper Back": lambda state:
-                (self.can_attack(state))
-                and (
-                    self.has_gem(state) and self.kick_or_plunge(state, 1)
-                    or self.kick_or_plunge(state, 2)),
-            "Listless Library - Locked Door Across": lambda state:
-                self.has_gem(state)
-                or self.get_kicks(state, 1)
-                or self.can_slidejump(state),
-            "Listless Library - Locked Door Left": lambda state:
-                self.has_gem(state)
-                or self.can_slidejump(state) and self.get_kicks(state, 1)
-                or self.kick_or_plunge(state, 3),
-            "Sansa Keep - Near Theatre": lambda state:
-                self.kick_or_plunge(state, 1)
-                or self.has_gem(state),
-            # "Sansa Keep - Alcove Near Locked Door": lambda state: True,
-            "Sansa Keep - Levers Room": lambda state:
-                self.can_attack(state),
-            "Sansa Keep - Sunsetter": lambda state:
-                self.can_attack(state),
-            "Sansa Keep - Strikebreak": lambda state:
-                self.has_breaker(state)
-                and (
-                    self.has_slide(state)
-                    or self.can_strikebreak(state))
-                and (
-                    self.has_gem(state)
-                    or self.has_plunge(state) and self.get_kicks(state, 1)
-                    or self.get_kicks(state, 3)),
-            "Sansa Keep - Lonely Throne": lambda state:
-                self.has_breaker(state) and self.has_gem(state)
-                and (
-                    self.has_plunge(state) and self.get_kicks(state, 1)
-                    or self.has_plunge(state) and self.can_bounce(state)
-                    or self.get_kicks(state, 1) and self.can_bounce(state))
-                or self.can_bounce(state) and self.kick_or_plunge(state, 4),
-            # "The Underbelly - Ascendant Light": lambda state: True,
-            "The Underbelly - Rafters Near Keep": lambda state:
-                self.has_plunge(state)
-                or self.get_kicks(state, 2)
-                or self.can_bounce(state),
-            "The Underbelly - Locked Door": lambda state:
-                self.has_small_keys(state),
-            "The Underbelly - Main Room": lambda state:
-                self.has_plunge(state)
-                or self.has_gem(state)
-                or self.get_kicks(state, 2)
-                or self.can_slidejump(state) and self.get_kicks(state, 1),
-            "The Underbelly - Alcove Near Light": lambda state:
-                self.can_attack(state)
-                or self.has_gem(state)
-                or self.get_kicks(state, 4)
-                or self.get_kicks(state, 3) and self.can_slidejump(state),
-            "The Underbelly - Building Near Little Guy": lambda state:
-                self.has_plunge(state)
-                or self.get_kicks(state, 3),
-            "The Underbelly - Strikebreak Wall": lambda state:
-                self.can_strikebreak(state)
-                and (
-                    self.can_bounce(state)
-                    or self.get_kicks(state, 4)
-                    or self.get_kicks(state, 2) and self.has_plunge(state)),
-            "The Underbelly - Surrounded By Holes": lambda state:
-                self.can_soulcutter(state)
-                and (
-                    self.can_bounce(state)
-                    or self.get_kicks(state, 2))
-                or self.can_slidejump(state) and self.has_gem(state) and self.get_kicks(state, 1),
+            # "Dilapidated Dungeon - Dream Breaker": True,
+            # "Dilapidated Dungeon - Slide": True,
+            # "Dilapidated Dungeon - Alcove Near Mirror": True,
+            "Dilapidated Dungeon - Dark Orbs":
+                Gem & Bounce
+                | Gem & KickOrPlunge(3)
+                | Kicks(2) & Bounce
+                | SlideJump & Kicks(1) & Bounce,
+            "Dilapidated Dungeon - Past Poles":
+                Gem & KickOrPlunge(1)
+                | Kicks(3),
+            "Dilapidated Dungeon - Rafters":
+                KickOrPlunge(3)
+                | Obscure & Bounce & Gem,
+            "Dilapidated Dungeon - Strong Eyes":
+                Breaker
+                | Obscure
+                & (
+                    Gem & Kicks(1) & Plunge
+                    | Gem & Kicks(3)),
+            # "Castle Sansa - Indignation": True,
+            "Castle Sansa - Alcove Near Dungeon":
+                Gem & KickOrPlunge(1)
+                | KickOrPlunge(2),
+            "Castle Sansa - Balcony":
+                Gem
+                | KickOrPlunge(3)
+                | SlideJump & KickOrPlunge(2),
+            "Castle Sansa - Corner Corridor":
+                Gem
+                | Kicks(4),
+            "Castle Sansa - Floater In Courtyard":
+                Bounce & Plunge
+                | Bounce & Kicks(2)
+                | Gem & Kicks(2)
+                | Gem & Plunge
+                | Kicks(4)
+                | Obscure & Bounce & Kicks(1)
+                | Obscure & Gem & Kicks(1),
+            "Castle Sansa - Locked Door":
+                SmallKeys,
+            "Castle Sansa - Platform In Main Halls":
+                Plunge
+                | Gem
+                | Kicks(2),
+            "Castle Sansa - Tall Room Near Wheel Crawlers":
+                Gem & KickOrPlunge(1)
+                | Kicks(2),
+            "Castle Sansa - Wheel Crawlers":
+                Bounce
+                | Gem
+                | Kicks(2)
+                | Kicks(1) & SlideJump
+                | Obscure & Plunge,
+            "Castle Sansa - High Climb From Courtyard":
+                Kicks(2)
+                | Gem & Plunge
+                | Breaker & Kicks(1)
+                | Obscure & Plunge & Kicks(1),
+            "Castle Sansa - Alcove Near Scythe Corridor":
+                Gem & Kicks(1) & Plunge
+                | KickOrPlunge(4),
+            "Castle Sansa - Near Theatre Front":
+                Kicks(4)
+                | Kicks(2) & Plunge,
+            "Listless Library - Sun Greaves":
+                Attack,
+            "Listless Library - Sun Greaves 1":
+                Attack,
+            "Listless Library - Sun Greaves 2":
+                Attack,
+            "Listless Library - Sun Greaves 3":
+                Attack,
+            "Listless Library - Upper Back":
+                (Attack)
+                & (
+                    Gem & KickOrPlunge(1)
+                    | KickOrPlunge(2)),
+            "Listless Library - Locked Door Across":
+                Gem
+                | Kicks(1)
+                | SlideJump,
+            "Listless Library - Locked Door Left":
+                Gem
+                | SlideJump & Kicks(1)
+                | KickOrPlunge(3),
+            "Sansa Keep - Near Theatre":
+                KickOrPlunge(1)
+                | Gem,
+            # "Sansa Keep - Alcove Near Locked Door": True,
+            "Sansa Keep - Levers Room":
+                Attack,
+            "Sansa Keep - Sunsetter":
+                Attack,
+            "Sansa Keep - Strikebreak":
+                Breaker
+                & (
+                    Slide
+                    | Strikebreak)
+                & (
+                    Gem
+                    | Plunge & Kicks(1)
+                    | Kicks(3)),
+            "Sansa Keep - Lonely Throne":
+                Breaker & Gem
+                & (
+                    Plunge & Kicks(1)
+                    | Plunge & Bounce
+                    | Kicks(1) & Bounce)
+                | Bounce & KickOrPlunge(4),
+            # "The Underbelly - Ascendant Light": True,
+            "The Underbelly - Rafters Near Keep":
+                Plunge
+                | Kicks(2)
+                | Bounce,
+            "The Underbelly - Locked Door":
+                SmallKeys,
+            "The Underbelly - Main Room":
+                Plunge
+                | Gem
+                | Kicks(2)
+                | SlideJump & Kicks(1),
+            "The Underbelly - Alcove Near Light":
+                Attack
+                | Gem
+                | Kicks(4)
+                | Kicks(3) & SlideJump,
+            "The Underbelly - Building Near Little Guy":
+                Plunge
+                | Kicks(3),
+            "The Underbelly - Strikebreak Wall":
+                Strikebreak
+                & (
+                    Bounce
+                    | Kicks(4)
+                    | Kicks(2) & Plunge),
+            "The Underbelly - Surrounded By Holes":
+                SoulCutter
+                & (
+                    Bounce
+                    | Kicks(2))
+                | SlideJump & Gem & Kicks(1),
         }
 
         self.apply_clauses(region_clauses, location_clauses)
-
-    def set_pseudoregalia_rules(self) -> None:
-        super().set_pseudoregalia_rules()
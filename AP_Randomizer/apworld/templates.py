@@ -0,0 +1,58 @@
+from typing import Dict, NamedTuple, Tuple, TYPE_CHECKING
+from .items import item_table, item_frequencies
+from .locations import location_table, region_locations
+
+if TYPE_CHECKING:
+    from . import PseudoregaliaWorld
+
+
+class WorldTemplate(NamedTuple):
+    """Everything about a world's regions, locations and item pool that only depends on its options."""
+    # Names of the locations created in each region, in location_table order.
+    region_locations: Dict[str, Tuple[str, ...]]
+    # Items added to the pool and how many of each, in item_table order.
+    item_counts: Dict[str, int]
+    # Item placed on each locked location.
+    locked_items: Dict[str, str]
+
+
+_templates: Dict[Tuple[bool, ...], WorldTemplate] = {}
+
+
+def get_template_key(world: "PseudoregaliaWorld") -> Tuple[bool, ...]:
+    # The only options any can_create looks at.
+    options = world.options
+    return bool(options.progressive_breaker), bool(options.progressive_slide), bool(options.split_sun_greaves)
+
+
+def build_template(world: "PseudoregaliaWorld") -> WorldTemplate:
+    region_location_names = {
+        region_name: tuple(name for name in location_names if location_table[name].can_create(world))
+        for region_name, location_names in region_locations.items()}
+
+    item_counts = {}
+    for item_name, item_data in item_table.items():
+        if (item_name == "Dream Breaker"):
+            continue  # Really skrunkled way of just adding the one locked breaker to the pool for now.
+        if (item_data.code and item_data.can_create(world)):
+            item_counts[item_name] = item_frequencies.get(item_name, 1)
+
+    locked_items = {}
+    for location_name, location_data in world.locked_locations.items():
+        if not location_data.can_create(world):
+            continue
+        locked_items[location_name] = location_data.locked_item
+    # Doing this really stupidly because breaker's locking will change after logic rework is done
+    if bool(world.options.progressive_breaker):
+        locked_items["Dilapidated Dungeon - Dream Breaker"] = "Progressive Dream Breaker"
+
+    return WorldTemplate(region_location_names, item_counts, locked_items)
+
+
+def get_template(world: "PseudoregaliaWorld") -> WorldTemplate:
+    """Returns the template for the world's options, building it the first time they're seen."""
+    key = get_template_key(world)
+    template = _templates.get(key)
+    if template is None:
+        template = _templates[key] = build_template(world)
+    return template
@@ -0,0 +1,33 @@
+import json
+import pkgutil
+from typing import Any, Callable, Dict, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import PseudoregaliaWorld
+
+# data/world.json holds the world graph and location metadata:
+#   regions: the names of the regions each region has exits to.
+#   locations: the region, id (missing for events), locked item, spoiler visibility and required options of each
+#   location. Sorted by greater region, then subregion, then abilities first, then alphabetically.
+#   Anything optional goes below the 50 base locations.
+# Required options map option names to whether they have to be on or off for the location to exist.
+# Dilapidated Dungeon - Dream Breaker is locked to the Dream Breaker because it can't really be shuffled right now,
+# but it would be nice to shuffle it later.
+
+OptionsPredicate = Callable[["PseudoregaliaWorld"], bool]
+
+world_data: Dict[str, Any] = json.loads(pkgutil.get_data(__package__, "data/world.json"))
+
+_predicates: Dict[Tuple[Tuple[str, bool], ...], OptionsPredicate] = {}
+
+
+def get_options_predicate(required_options: Dict[str, bool]) -> OptionsPredicate:
+    """Returns a predicate that's True for worlds whose options match required_options.
+    Equal requirements share one predicate."""
+    key = tuple(sorted(required_options.items()))
+    predicate = _predicates.get(key)
+    if predicate is None:
+        def predicate(world: "PseudoregaliaWorld") -> bool:
+            return all(bool(getattr(world.options, name)) == value for name, value in key)
+        _predicates[key] = predicate
+    return predicate
@@ -0,0 +1,121 @@
+"""Offline generation benchmark for the apworld, run against the stand-in Archipelago core in stubs/.
+
+Times each world stage and full reachability sweeps for every combination in harness.option_matrix,
+then measures peak memory of one generation and sweep per combination with tracemalloc.
+
+    python AP_Randomizer/tools/benchmark.py --players 8 --json bench.json
+    python AP_Randomizer/tools/benchmark.py --baseline bench.json
+    python AP_Randomizer/tools/benchmark.py --logic-level 4 --profile 20
+
+A sweep collects every advancement item in a player's pool one at a time in a seeded order, checking every
+location of that player after each item, the way fill does. Stage times are per world, best of --repeat runs.
+--profile instruments the installed rules with profiling.RuleProfile, which slows them down considerably,
+and prints the rules that took the most time once every combination has run.
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from typing import Dict
+
+import harness
+from BaseClasses import CollectionState, MultiWorld
+
+
+def sweep(multiworld: MultiWorld, seed: int) -> int:
+    """Runs one reachability sweep per player and returns the number of location checks made."""
+    checks = 0
+    state = CollectionState(multiworld)
+    for player in multiworld.player_ids:
+        items = [item for item in multiworld.itempool if item.player == player and item.advancement]
+        items += [location.item for location in multiworld.get_filled_locations(player) if location.advancement]
+        random.Random(seed).shuffle(items)
+        locations = multiworld.get_locations(player)
+        for item in items:
+            state.collect(item, True)
+            for location in locations:
+                location.can_reach(state)
+            checks += len(locations)
+    return checks
+
+
+def benchmark_options(apworld, options: Dict[str, int], players: int, repeat: int, seed: int) -> Dict[str, float]:
+    result = {stage: float("inf") for stage in harness.stages}
+    result["sweep"] = float("inf")
+    checks = 0
+    for _ in range(repeat):
+        multiworld = harness.create_multiworld(apworld, options, players, seed, run_stages=False)
+        for stage in harness.stages:
+            start = time.perf_counter()
+            harness.run_stage(multiworld, stage)
+            result[stage] = min(result[stage], (time.perf_counter() - start) / players)
+        start = time.perf_counter()
+        checks = sweep(multiworld, seed)
+        result["sweep"] = min(result["sweep"], time.perf_counter() - start)
+    result["sweeps_per_second"] = players / result["sweep"]
+    result["checks_per_second"] = checks / result["sweep"]
+
+    tracemalloc.start()
+    multiworld = harness.create_multiworld(apworld, options, players, seed)
+    sweep(multiworld, seed)
+    result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result
+
+
+def format_row(options: Dict[str, int], result: Dict[str, float], baseline: Dict[str, float]) -> str:
+    columns = [f"{result[stage] * 1000:8.3f}" for stage in harness.stages]
+    columns.append(f"{result['sweeps_per_second']:9.1f}")
+    columns.append(f"{result['checks_per_second']:11.0f}")
+    columns.append(f"{result['peak_memory'] / 1024:9.0f}")
+    if baseline:
+        change = result["sweeps_per_second"] / baseline["sweeps_per_second"] - 1
+        columns.append(f"{change:+8.1%}")
+    return " ".join(columns) + "  " + harness.describe_options(options)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=1, help="Pseudoregalia players per multiworld")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per combination, the best one is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--logic-level", type=int, action="append", help="only benchmark these logic levels")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare sweeps/s against results written by --json")
+    parser.add_argument("--profile", type=int, metavar="RULES", help="report the slowest rules")
+    args = parser.parse_args()
+
+    baseline: Dict[str, Dict[str, float]] = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = {harness.describe_options(entry["options"]): entry["result"] for entry in json.load(file)}
+
+    apworld = harness.load_apworld()
+    if args.profile:
+        apworld.profiling.rule_profile = apworld.profiling.RuleProfile()
+    header = [f"{stage[:8]:>8}" for stage in harness.stages] + ["sweeps/s", "  checks/s", "peak KiB"]
+    if baseline:
+        header.append("  change")
+    print("stage times in ms per world")
+    print(" ".join(header))
+
+    results = []
+    for options in harness.option_matrix:
+        if args.logic_level and options["logic_level"] not in args.logic_level:
+            continue
+        result = benchmark_options(apworld, options, args.players, args.repeat, args.seed)
+        results.append({"options": options, "result": result})
+        print(format_row(options, result, baseline.get(harness.describe_options(options), {})))
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.profile:
+        print()
+        print(apworld.profiling.rule_profile.report(args.profile))
+
+
+if __name__ == "__main__":
+    main()
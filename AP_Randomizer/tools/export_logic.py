@@ -0,0 +1,72 @@
+"""Exports the compiled logic of every option combination, see export.py in the apworld for the format.
+
+    python AP_Randomizer/tools/export_logic.py logic/
+    python AP_Randomizer/tools/export_logic.py --check-hash-seeds
+
+Writes <fingerprint>.json for every distinct logic, matching the logic_fingerprint in slot data, and
+index.json listing the fingerprint for each combination in harness.option_matrix.
+--check-hash-seeds instead computes every fingerprint in two fresh interpreters with different PYTHONHASHSEED
+values and fails if any differ, since trackers rely on the same logic always having the same fingerprint.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import List
+
+import harness
+
+
+def get_fingerprints(apworld) -> List[str]:
+    return [apworld.export.get_logic_fingerprint(harness.create_multiworld(apworld, options).worlds[1])
+            for options in harness.option_matrix]
+
+
+def check_hash_seeds() -> bool:
+    outputs = []
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        outputs.append(subprocess.run([sys.executable, __file__, "--print-fingerprints"], env=env, check=True,
+                                      stdout=subprocess.PIPE, universal_newlines=True).stdout.splitlines())
+    for options, first, second in zip(harness.option_matrix, *outputs):
+        if first != second:
+            print(f"FAIL {harness.describe_options(options)}: {first} with PYTHONHASHSEED=1, {second} with 2")
+    if outputs[0] != outputs[1]:
+        return False
+    print(f"{len(outputs[0])} fingerprints match across hash seeds")
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", nargs="?")
+    parser.add_argument("--check-hash-seeds", action="store_true",
+                        help="check fingerprints don't depend on PYTHONHASHSEED instead of exporting")
+    parser.add_argument("--print-fingerprints", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.check_hash_seeds:
+        sys.exit(0 if check_hash_seeds() else 1)
+    apworld = harness.load_apworld()
+    if args.print_fingerprints:
+        print("\n".join(get_fingerprints(apworld)))
+        return
+    if args.directory is None:
+        parser.error("the directory to export to is required")
+
+    export = apworld.export
+    os.makedirs(args.directory, exist_ok=True)
+    index = []
+    for options in harness.option_matrix:
+        world = harness.create_multiworld(apworld, options).worlds[1]
+        fingerprint = export.get_logic_fingerprint(world)
+        index.append({"options": options, "fingerprint": fingerprint})
+        with open(os.path.join(args.directory, f"{fingerprint}.json"), "w") as file:
+            file.write(export.dump_logic(export.export_logic(world)))
+    with open(os.path.join(args.directory, "index.json"), "w") as file:
+        file.write(export.dump_logic({"version": export.export_version, "logic": index}))
+    print(f"{len(set(entry['fingerprint'] for entry in index))} distinct logic files written to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""A plain assumed fill and playthrough for multiworlds built by harness, standing in for Archipelago's Fill."""
+import random
+from typing import List
+
+import harness  # noqa: F401, puts the stand-in core on the path
+from BaseClasses import CollectionState, Item, Location, MultiWorld
+
+
+class FillError(Exception):
+    pass
+
+
+def sweep_state(multiworld: MultiWorld, items: List[Item]) -> CollectionState:
+    state = CollectionState(multiworld)
+    for item in items:
+        state.collect(item, True)
+    state.sweep_for_advancements()
+    return state
+
+
+def place(location: Location, item: Item) -> None:
+    location.item = item
+    item.location = location
+
+
+def distribute_early_items(multiworld: MultiWorld, locations: List[Location], pool: List[Item],
+                           rng: random.Random) -> None:
+    """Places the items in local_early_items and early_items into locations reachable without any item from the
+    pool, removing them from locations and pool. Items that don't fit stay in the pool, like Archipelago does."""
+    state = sweep_state(multiworld, [])
+    early_locations = [location for location in locations if location.can_reach(state)]
+    rng.shuffle(early_locations)
+    for player in multiworld.player_ids:
+        for local, early_items in ((True, multiworld.local_early_items), (False, multiworld.early_items)):
+            for name, count in early_items[player].items():
+                for _ in range(count):
+                    item = next((item for item in pool if item.player == player and item.name == name), None)
+                    location = next((location for location in early_locations
+                                     if not local or location.player == player), None)
+                    if item is None or location is None:
+                        break
+                    place(location, item)
+                    pool.remove(item)
+                    early_locations.remove(location)
+                    locations.remove(location)
+
+
+def fill(multiworld: MultiWorld, rng: random.Random) -> int:
+    """Places the item pool into the unfilled locations and returns the number of swaps it took.
+    Early items go first, then progression is placed with assumed fill, each item going to a location reachable
+    with every progression item not placed yet. When no location is left for an item, it takes the location of
+    an item placed before it, which goes back to be placed again, like Archipelago's swap. The rest of the pool
+    is placed at random."""
+    locations: List[Location] = multiworld.get_unfilled_locations()
+    rng.shuffle(locations)
+    pool = list(multiworld.itempool)
+    if len(pool) > len(locations):
+        raise FillError(f"{len(pool)} items for {len(locations)} locations")
+    distribute_early_items(multiworld, locations, pool, rng)
+    progression = [item for item in pool if item.advancement]
+    others = [item for item in pool if not item.advancement]
+    rng.shuffle(progression)
+    rng.shuffle(others)
+
+    placements: List[Location] = []
+    swaps = 0
+    max_swaps = len(progression) * 10
+    while progression:
+        item = progression.pop()
+        state = sweep_state(multiworld, progression)
+        for index, location in enumerate(locations):
+            if location.can_fill(state, item):
+                place(location, item)
+                placements.append(location)
+                del locations[index]
+                break
+        else:
+            for location in reversed(placements):
+                placed = location.item
+                location.item = None
+                if location.can_fill(sweep_state(multiworld, progression + [placed]), item):
+                    place(location, item)
+                    placed.location = None
+                    progression.append(placed)
+                    swaps += 1
+                    break
+                location.item = placed
+            else:
+                raise FillError(f"No reachable location left for {item}")
+            if swaps > max_swaps:
+                raise FillError(f"Gave up after {swaps} swaps")
+
+    for item, location in zip(others, locations):
+        place(location, item)
+    return swaps
+
+
+def count_spheres(multiworld: MultiWorld) -> int:
+    """Collects every reachable advancement item sphere by sphere and returns the number of spheres,
+    raising FillError if the game can't be beaten."""
+    state = CollectionState(multiworld)
+    locations = [location for location in multiworld.get_filled_locations() if location.advancement]
+    spheres = 0
+    while True:
+        sphere = [location for location in locations
+                  if location not in state.locations_checked and location.can_reach(state)]
+        if not sphere:
+            break
+        spheres += 1
+        for location in sphere:
+            state.collect(location.item, True, location)
+    if not multiworld.has_beaten_game(state):
+        raise FillError(f"Game can't be beaten, {spheres} spheres reached")
+    return spheres
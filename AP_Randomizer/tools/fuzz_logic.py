@@ -0,0 +1,311 @@
+"""Checks the logic for monotonicity and consistency, shrinking any counterexample it finds.
+
+    python AP_Randomizer/tools/fuzz_logic.py --inventories 1000000 --workers 4
+
+Checks, for every logic level, obscure logic and split sun greaves combination:
+- capabilities: raising any capability by one level never loses a region or location, for every vector.
+- tiers: Normal <= Hard <= Expert <= Lunatic and obscure off <= obscure on, for every vector.
+- items: for random inventories drawn from each combination's item pool, collecting one more item never
+  loses a capability, region or location. Inventories are evaluated through get_capabilities and the
+  reachability table, so millions of them take seconds; --workers splits them across processes.
+- rules: for a sample of random inventories, sweeping a real CollectionState reaches exactly what the
+  reachability table says.
+- golden: for every combination in harness.option_matrix, the reachability table reaches exactly what the
+  original lambda rules did for each inventory in data/golden_reachability.json.gz, see golden_reachability.py.
+- pickle: every multiworld survives a round trip through pickle, and sweeping the copy reaches exactly what
+  the original does for the same inventories.
+"""
+import argparse
+import pickle
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+import golden_reachability
+import harness
+from BaseClasses import CollectionState
+
+# (logic level, obscure logic, split sun greaves), the options a reachability table depends on.
+TableKey = Tuple[int, int, int]
+table_keys: List[TableKey] = [(level, obscure, split) for level in (1, 2, 3, 4) for obscure in (0, 1)
+                              for split in (0, 1) if obscure or level < 3]
+# Pairs of (easier, harder) logic levels and obscure logic that must only ever add reachable things.
+tier_order: List[Tuple[Tuple[int, int], Tuple[int, int]]] = [
+    ((1, 0), (1, 1)), ((1, 0), (2, 0)), ((1, 1), (2, 1)), ((2, 0), (2, 1)), ((2, 1), (3, 1)), ((3, 1), (4, 1))]
+
+_apworld = None
+_worlds: Dict[TableKey, object] = {}
+_tables: Dict[TableKey, Dict[int, Tuple[int, int]]] = {}
+
+
+def load() -> None:
+    global _apworld
+    _apworld = harness.load_apworld()
+    for key in table_keys:
+        level, obscure, split = key
+        options = {"logic_level": level, "obscure_logic": obscure, "split_sun_greaves": split}
+        world = _worlds[key] = harness.create_multiworld(_apworld, options).worlds[1]
+        _tables[key] = _apworld.reachability.build_table(world)
+
+
+def describe_loss(before: Tuple[int, int], after: Tuple[int, int]) -> str:
+    """Names the regions and locations in before missing from after."""
+    reachability = _apworld.reachability
+    lost = [name for name, bit in reachability.region_bits.items() if before[0] & bit and not after[0] & bit]
+    lost += [name for name, bit in reachability.location_bits.items() if before[1] & bit and not after[1] & bit]
+    return ", ".join(lost)
+
+
+def loses(before: Tuple[int, int], after: Tuple[int, int]) -> bool:
+    return bool(before[0] & ~after[0] or before[1] & ~after[1])
+
+
+def get_capability_steps() -> List[Tuple[int, ...]]:
+    """Every leveled capability as its cumulative levels, single capabilities as (0, bit)."""
+    capabilities = _apworld.constants.capabilities
+    return [capabilities.BREAKER_LEVELS, capabilities.SLIDE_LEVELS, capabilities.KICKS,
+            (0, capabilities.PLUNGE), (0, capabilities.GEM), (0, capabilities.LIGHT),
+            (0, capabilities.SMALL_KEYS[6], capabilities.SMALL_KEYS[7]), (0, capabilities.MAJOR_KEYS)]
+
+
+def get_level(vector: int, levels: Tuple[int, ...]) -> int:
+    mask = levels[-1]
+    return levels.index(vector & mask)
+
+
+def set_level(vector: int, levels: Tuple[int, ...], level: int) -> int:
+    return vector & ~levels[-1] | levels[level]
+
+
+def shrink_vector(vector: int, fails) -> int:
+    """Lowers capabilities one level at a time as long as fails(vector) stays True."""
+    steps = get_capability_steps()
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        for levels in steps:
+            level = get_level(vector, levels)
+            if level and fails(set_level(vector, levels, level - 1)):
+                vector = set_level(vector, levels, level - 1)
+                shrunk = True
+    return vector
+
+
+def check_capabilities() -> List[str]:
+    failures = []
+    describe = _apworld.logic.describe
+    for key, table in _tables.items():
+        for levels in get_capability_steps():
+            def fails(vector: int) -> bool:
+                level = get_level(vector, levels)
+                return level + 1 < len(levels) and loses(table[vector], table[set_level(vector, levels, level + 1)])
+
+            found = next((vector for vector in table if fails(vector)), None)
+            if found is not None:
+                vector = shrink_vector(found, fails)
+                raised = set_level(vector, levels, get_level(vector, levels) + 1)
+                failures.append(f"{key}: {describe((vector,))} -> {describe((raised,))} loses "
+                                f"{describe_loss(table[vector], table[raised])}")
+    return failures
+
+
+def check_tiers() -> List[str]:
+    failures = []
+    describe = _apworld.logic.describe
+    for split in (0, 1):
+        for easier, harder in tier_order:
+            easier_table = _tables[(*easier, split)]
+            harder_table = _tables[(*harder, split)]
+
+            def fails(vector: int) -> bool:
+                return loses(easier_table[vector], harder_table[vector])
+
+            found = next((vector for vector in easier_table if fails(vector)), None)
+            if found is not None:
+                vector = shrink_vector(found, fails)
+                failures.append(f"split={split} {easier} -> {harder} with {describe((vector,))} loses "
+                                f"{describe_loss(easier_table[vector], harder_table[vector])}")
+    return failures
+
+
+def get_item_pool(key: TableKey) -> List[str]:
+    world = _worlds[key]
+    multiworld = world.multiworld
+    pool = [item.name for item in multiworld.itempool if item.advancement]
+    pool += [location.item.name for location in multiworld.get_filled_locations() if location.advancement]
+    return pool
+
+
+def shrink_inventory(inventory: List[str], fails) -> List[str]:
+    """Removes items one at a time as long as fails(inventory) stays True."""
+    index = 0
+    while index < len(inventory):
+        smaller = inventory[:index] + inventory[index + 1:]
+        if fails(smaller):
+            inventory = smaller
+        else:
+            index += 1
+    return inventory
+
+
+def check_items(seed: int, inventories: int) -> List[str]:
+    """Checks random inventories for every table key, returning the first shrunk counterexample of each."""
+    get_capabilities = _apworld.rules.get_capabilities
+    failures = []
+    for key in table_keys:
+        table = _tables[key]
+        pool = get_item_pool(key)
+        rng = random.Random(f"{seed} {key}")
+        for _ in range(inventories // len(table_keys)):
+            probability = rng.random()
+            inventory = [name for name in pool if rng.random() < probability]
+            extra = rng.choice(pool)
+
+            def fails(items: List[str]) -> bool:
+                before = get_capabilities(Counter(items))
+                after = get_capabilities(Counter(items + [extra]))
+                return bool(before & ~after) or loses(table[before], table[after])
+
+            if fails(inventory):
+                inventory = shrink_inventory(inventory, fails)
+                before = get_capabilities(Counter(inventory))
+                after = get_capabilities(Counter(inventory + [extra]))
+                failures.append(f"{key}: collecting {extra} with [{', '.join(inventory)}] loses "
+                                f"{describe_loss(table[before], table[after]) or 'capabilities'}")
+                break
+    return failures
+
+
+def sweep_inventory(world, inventory: List[str]) -> Tuple[int, int]:
+    """Returns bitsets of the regions and locations a CollectionState holding inventory reaches."""
+    reachability = _apworld.reachability
+    state = CollectionState(world.multiworld)
+    for name in inventory:
+        state.collect(world.create_item(name), True)
+    regions = sum(reachability.region_bits[region.name] for region in world.regions_by_name.values()
+                  if region.can_reach(state))
+    locations = sum(reachability.location_bits[location.name]
+                    for location in world.locations_by_name.values() if location.can_reach(state))
+    return regions, locations
+
+
+def check_rules(seed: int, inventories: int) -> List[str]:
+    """Compares sweeping the installed rules with the table lookup for random inventories."""
+    get_capabilities = _apworld.rules.get_capabilities
+    failures = []
+    for key in table_keys:
+        table = _tables[key]
+        pool = get_item_pool(key)
+        rng = random.Random(f"{seed} {key}")
+        for _ in range(inventories):
+            probability = rng.random()
+            inventory = [name for name in pool if rng.random() < probability]
+            reached = sweep_inventory(_worlds[key], inventory)
+            expected = table[get_capabilities(Counter(inventory))]
+            if reached != expected:
+                failures.append(f"{key}: rules and table disagree for [{', '.join(inventory)}], "
+                                f"table only: {describe_loss(expected, reached)}, "
+                                f"rules only: {describe_loss(reached, expected)}")
+                break
+    return failures
+
+
+def check_golden() -> List[str]:
+    """Compares the table lookup for every recorded inventory with what the original lambda rules reached."""
+    get_capabilities = _apworld.rules.get_capabilities
+    reachability = _apworld.reachability
+    golden = golden_reachability.load_golden()
+    results = [(int(regions, 16), int(locations, 16)) for regions, locations in golden["results"]]
+    failures = []
+    for combination in golden["combinations"]:
+        options = combination["options"]
+        world = harness.create_multiworld(_apworld, options).worlds[1]
+        table = reachability.get_table(world)
+        # The golden bits of the regions and locations the current logic creates, to compare with the table.
+        region_bits = [(1 << index, reachability.region_bits[name])
+                       for index, name in enumerate(golden["regions"]) if name in world.regions_by_name]
+        location_bits = [(1 << index, reachability.location_bits[name])
+                         for index, name in enumerate(golden["locations"]) if name in world.locations_by_name]
+        inventories = golden_reachability.get_inventories(options)
+        for inventory, index in zip(inventories, combination["results"]):
+            golden_regions, golden_locations = results[index]
+            expected = (sum(bit for golden_bit, bit in region_bits if golden_regions & golden_bit),
+                        sum(bit for golden_bit, bit in location_bits if golden_locations & golden_bit))
+            reached = table[get_capabilities(Counter(inventory))]
+            reached = (reached[0] & sum(bit for _, bit in region_bits),
+                       reached[1] & sum(bit for _, bit in location_bits))
+            if reached != expected:
+                failures.append(f"{harness.describe_options(options)}: table and original rules disagree for "
+                                f"{inventory}, table only: {describe_loss(reached, expected)}, "
+                                f"original only: {describe_loss(expected, reached)}")
+                break
+    return failures
+
+
+def check_pickle(seed: int, inventories: int) -> List[str]:
+    """Round trips every multiworld through pickle and compares sweeping the copy with the original."""
+    failures = []
+    for key in table_keys:
+        world = _worlds[key]
+        try:
+            copy = pickle.loads(pickle.dumps(world.multiworld)).worlds[world.player]
+        except Exception as error:
+            failures.append(f"{key}: multiworld can't be pickled: {error!r}")
+            continue
+        pool = get_item_pool(key)
+        rng = random.Random(f"{seed} {key}")
+        for _ in range(inventories):
+            probability = rng.random()
+            inventory = [name for name in pool if rng.random() < probability]
+            reached = sweep_inventory(world, inventory)
+            copy_reached = sweep_inventory(copy, inventory)
+            if reached != copy_reached:
+                failures.append(f"{key}: pickled copy disagrees for [{', '.join(inventory)}], "
+                                f"original only: {describe_loss(reached, copy_reached)}, "
+                                f"copy only: {describe_loss(copy_reached, reached)}")
+                break
+            if copy.multiworld.has_beaten_game(CollectionState(copy.multiworld)):
+                failures.append(f"{key}: pickled copy is beaten without any item")
+                break
+    return failures
+
+
+def run_batch(seed: int, inventories: int) -> List[str]:
+    if _apworld is None:
+        load()
+    return check_items(seed, inventories)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inventories", type=int, default=100000, help="random inventories for the item check")
+    parser.add_argument("--sweeps", type=int, default=200, help="random inventories per table for the rule check")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    load()
+    failures = (check_capabilities() + check_tiers() + check_rules(args.seed, args.sweeps) + check_golden()
+                + check_pickle(args.seed, args.sweeps))
+    batches = max(1, args.workers) * 4
+    seeds = [args.seed * batches + batch for batch in range(batches)]
+    counts = [args.inventories // batches] * batches
+    if args.workers > 1:
+        with ProcessPoolExecutor(args.workers) as executor:
+            results = list(executor.map(run_batch, seeds, counts))
+    else:
+        results = [run_batch(seed, count) for seed, count in zip(seeds, counts)]
+    for batch_failures in results:
+        failures += [failure for failure in batch_failures if failure not in failures]
+
+    print(f"{len(table_keys)} tables, {len(_apworld.reachability.capability_space)} vectors each, "
+          f"{sum(counts)} random inventories, {args.sweeps * len(table_keys)} rule and pickle sweeps")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if not failures:
+        print("no counterexamples found")
+
+
+if __name__ == "__main__":
+    main()
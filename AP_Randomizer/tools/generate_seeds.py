@@ -0,0 +1,127 @@
+"""Generates and validates many seeds in parallel against the stand-in Archipelago core.
+
+    python AP_Randomizer/tools/generate_seeds.py --seeds 2000
+    python AP_Randomizer/tools/generate_seeds.py --seeds 500 --players 8 --workers 4
+    python AP_Randomizer/tools/generate_seeds.py --seeds 500 --players 16 --set early_enabler=1
+
+Every seed runs all world stages, fill.fill, fill.count_spheres and every world's get_playthrough.
+Seed n always gets the same options and the same result: with one player it uses combination n of
+harness.option_matrix (cycling), with more players each one gets a combination drawn from random.Random(n),
+mixing options within the multiworld. --set overrides an option for every player, e.g. to compare fill swaps
+and fill time with and without an option.
+Failures, stage timings, fill swaps, sphere counts and required progression are collected into one summary.
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+import fill
+import harness
+
+_apworld = None
+
+
+def load_worker() -> None:
+    global _apworld
+    _apworld = harness.load_apworld()
+
+
+def get_seed_options(seed: int, players: int, overrides: Dict[str, int]) -> List[Dict[str, int]]:
+    if players == 1:
+        return [{**harness.option_matrix[seed % len(harness.option_matrix)], **overrides}]
+    rng = random.Random(seed)
+    return [{**rng.choice(harness.option_matrix), **overrides} for _ in range(players)]
+
+
+def generate_seed(seed: int, players: int, overrides: Dict[str, int]) -> Dict[str, Any]:
+    options = get_seed_options(seed, players, overrides)
+    result: Dict[str, Any] = {"seed": seed, "options": options, "times": {}, "swaps": None, "spheres": None,
+                              "required": None, "error": None}
+    times = result["times"]
+    try:
+        multiworld = harness.create_multiworld(_apworld, options, players, seed, run_stages=False)
+        for stage in harness.stages:
+            start = time.perf_counter()
+            harness.run_stage(multiworld, stage)
+            times[stage] = time.perf_counter() - start
+        start = time.perf_counter()
+        result["swaps"] = fill.fill(multiworld, random.Random(seed))
+        times["fill"] = time.perf_counter() - start
+        start = time.perf_counter()
+        result["spheres"] = fill.count_spheres(multiworld)
+        times["spheres"] = time.perf_counter() - start
+        start = time.perf_counter()
+        playthroughs = [world.get_playthrough() for world in multiworld.worlds.values()]
+        result["required"] = [len(playthrough.required) for playthrough in playthroughs if playthrough.complete]
+        times["playthrough"] = time.perf_counter() - start
+    except Exception as error:
+        result["error"] = "".join(traceback.format_exception_only(type(error), error)).strip()
+        if not isinstance(error, fill.FillError):
+            result["error"] += "\n" + traceback.format_exc()
+    return result
+
+
+def summarize(results: List[Dict[str, Any]], elapsed: float, workers: int) -> str:
+    lines = [f"{len(results)} seeds in {elapsed:.2f} s with {workers} workers, {len(results) / elapsed:.1f} seeds/s"]
+    failures = [result for result in results if result["error"]]
+    lines.append(f"{len(failures)} failed")
+    for result in failures[:20]:
+        lines.append(f"  seed {result['seed']}: {result['error'].splitlines()[0]}")
+        for options in result["options"]:
+            lines.append(f"    {harness.describe_options(options)}")
+
+    lines.append(f"{'stage':>16} {'mean ms':>9} {'p95 ms':>9}")
+    for stage in (*harness.stages, "fill", "spheres", "playthrough"):
+        times = sorted(result["times"][stage] for result in results if stage in result["times"])
+        if times:
+            p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+            lines.append(f"{stage:>16} {statistics.mean(times) * 1000:9.3f} {p95 * 1000:9.3f}")
+
+    swaps = [result["swaps"] for result in results if result["swaps"] is not None]
+    if swaps:
+        lines.append(f"fill swaps: {sum(swaps)} total, {statistics.mean(swaps):.2f} per seed, "
+                     f"{sum(1 for count in swaps if count)} seeds with any")
+
+    required = [count for result in results if result["required"] for count in result["required"]]
+    if required:
+        lines.append(f"required progression of players with only local progression: "
+                     f"mean {statistics.mean(required):.1f}, min {min(required)}, max {max(required)}")
+
+    spheres = Counter(result["spheres"] for result in results if result["spheres"] is not None)
+    if spheres:
+        lines.append("spheres: " + ", ".join(f"{count}: {seeds}" for count, seeds in sorted(spheres.items())))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", type=int, default=100)
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--players", type=int, default=1, help="Pseudoregalia players per multiworld")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes, 1 runs in this process")
+    parser.add_argument("--set", action="append", default=[], metavar="OPTION=VALUE",
+                        help="override an option for every player")
+    args = parser.parse_args()
+    overrides = {name: int(value) for name, value in (override.split("=", 1) for override in args.set)}
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    start = time.perf_counter()
+    if args.workers == 1:
+        load_worker()
+        results = [generate_seed(seed, args.players, overrides) for seed in seeds]
+    else:
+        with ProcessPoolExecutor(args.workers, initializer=load_worker) as executor:
+            chunksize = max(1, len(seeds) // (args.workers * 8))
+            results = list(executor.map(generate_seed, seeds, [args.players] * len(seeds), [overrides] * len(seeds),
+                                        chunksize=chunksize))
+    print(summarize(results, time.perf_counter() - start, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Records what the original lambda rules reach, as a regression anchor for the compiled logic.
+
+    python AP_Randomizer/tools/golden_reachability.py --apworld /path/to/baseline/apworld
+
+For every combination in harness.option_matrix, sweeps a CollectionState holding each inventory from
+get_inventories with the apworld at --apworld, which should be a checkout of the commit before the logic was
+compiled (156e39b2), and writes the regions and locations reached to data/golden_reachability.json.gz.
+fuzz_logic.py checks the current logic against that file, so it doesn't depend on the rules it's checking.
+"""
+import argparse
+import gzip
+import itertools
+import json
+import os
+from typing import Dict, Iterator, List, Tuple
+
+import harness
+from BaseClasses import CollectionState
+
+golden_file = os.path.join(harness.tools_dir, "data", "golden_reachability.json.gz")
+
+Inventory = Dict[str, int]
+
+
+def get_inventories(options: Dict[str, int]) -> Iterator[Inventory]:
+    """Yields every combination of progression item counts the logic distinguishes, in a fixed order:
+    every count of each ability, 0, 6 or 7 small keys and none, four or all five major keys."""
+    if options["progressive_breaker"]:
+        breaker = [{"Progressive Dream Breaker": count} for count in range(4)]
+    else:
+        breaker = [{"Dream Breaker": a, "Strikebreak": b, "Soul Cutter": c}
+                   for a, b, c in itertools.product((0, 1), repeat=3)]
+    if options["progressive_slide"]:
+        slide = [{"Progressive Slide": count} for count in range(3)]
+    else:
+        slide = [{"Slide": a, "Solar Wind": b} for a, b in itertools.product((0, 1), repeat=2)]
+    if options["split_sun_greaves"]:
+        kicks = [{"Air Kick": count} for count in range(5)]
+    else:
+        kicks = [{"Sun Greaves": a, "Heliacal Power": b} for a, b in itertools.product((0, 1), repeat=2)]
+    singles = [{"Sunsetter": a, "Cling Gem": b, "Ascendant Light": c}
+               for a, b, c in itertools.product((0, 1), repeat=3)]
+    small_keys = [{"Small Key": count} for count in (0, 6, 7)]
+    major_key_names = ["Major Key - Empty Bailey", "Major Key - The Underbelly", "Major Key - Tower Remains",
+                       "Major Key - Sansa Keep", "Major Key - Twilight Theatre"]
+    major_keys = [{name: 1 for name in major_key_names[:count]} for count in (0, 4, 5)]
+    for parts in itertools.product(breaker, slide, kicks, singles, small_keys, major_keys):
+        inventory = {}
+        for part in parts:
+            inventory.update((name, count) for name, count in part.items() if count)
+        yield inventory
+
+
+def sweep(multiworld, inventory: Inventory) -> Tuple[List[str], List[str]]:
+    world = multiworld.worlds[1]
+    state = CollectionState(multiworld)
+    for name, count in inventory.items():
+        for _ in range(count):
+            state.collect(world.create_item(name), True)
+    regions = [region.name for region in multiworld.regions.region_cache[1].values() if region.can_reach(state)]
+    locations = [location.name for location in multiworld.get_locations(1) if location.can_reach(state)]
+    return regions, locations
+
+
+def load_golden() -> Dict:
+    with gzip.open(golden_file, "rt") as file:
+        return json.load(file)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apworld", required=True, help="apworld directory with the original lambda rules")
+    args = parser.parse_args()
+
+    apworld = harness.load_apworld(args.apworld)
+    # Bit index of every region and location, in the order they're first seen.
+    region_bits: Dict[str, int] = {}
+    location_bits: Dict[str, int] = {}
+    results: Dict[Tuple[int, int], int] = {}
+    combinations = []
+    for options in harness.option_matrix:
+        multiworld = harness.create_multiworld(apworld, options)
+        indices = []
+        for inventory in get_inventories(options):
+            regions, locations = sweep(multiworld, inventory)
+            result = (sum(1 << region_bits.setdefault(name, len(region_bits)) for name in regions),
+                      sum(1 << location_bits.setdefault(name, len(location_bits)) for name in locations))
+            indices.append(results.setdefault(result, len(results)))
+        combinations.append({"options": options, "results": indices})
+        print(f"{len(indices)} inventories, {len(results)} distinct results so far  "
+              f"{harness.describe_options(options)}")
+
+    golden = {"regions": list(region_bits), "locations": list(location_bits),
+              "results": [[f"{regions:x}", f"{locations:x}"] for regions, locations in results],
+              "combinations": combinations}
+    os.makedirs(os.path.dirname(golden_file), exist_ok=True)
+    with gzip.GzipFile(golden_file, "wb", mtime=0) as file:
+        file.write(json.dumps(golden, separators=(",", ":")).encode())
+
+
+if __name__ == "__main__":
+    main()
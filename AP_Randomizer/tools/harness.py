@@ -0,0 +1,71 @@
+"""Loads the apworld against the stand-in Archipelago core in stubs/ and builds multiworlds from it.
+Shared by the scripts in this directory, none of which are part of the apworld itself."""
+import dataclasses
+import importlib.util
+import itertools
+import os
+import sys
+from types import ModuleType
+from typing import Dict, List, Union
+
+tools_dir = os.path.dirname(os.path.abspath(__file__))
+apworld_dir = os.path.join(os.path.dirname(tools_dir), "apworld")
+sys.path.insert(0, os.path.join(tools_dir, "stubs"))
+
+from BaseClasses import MultiWorld  # noqa: E402
+
+package_name = "worlds.pseudoregalia"
+stages = ("generate_early", "create_regions", "create_items", "set_rules", "pre_fill")
+
+# Every combination of the options that change logic: 4 logic levels x obscure x progressive breaker
+# x progressive slide x split sun greaves.
+option_matrix: List[Dict[str, int]] = [
+    {"logic_level": logic_level, "obscure_logic": obscure_logic, "progressive_breaker": progressive_breaker,
+     "progressive_slide": progressive_slide, "split_sun_greaves": split_sun_greaves}
+    for logic_level, obscure_logic, progressive_breaker, progressive_slide, split_sun_greaves
+    in itertools.product((1, 2, 3, 4), (0, 1), (0, 1), (0, 1), (0, 1))
+]
+
+
+def load_apworld(path: str = apworld_dir) -> ModuleType:
+    """Imports the apworld at path as worlds.pseudoregalia, discarding any previously imported copy."""
+    for name in [name for name in sys.modules if name == package_name or name.startswith(package_name + ".")]:
+        del sys.modules[name]
+    spec = importlib.util.spec_from_file_location(package_name, os.path.join(path, "__init__.py"),
+                                                  submodule_search_locations=[path])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[package_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def create_multiworld(apworld: ModuleType, options: Union[Dict[str, int], List[Dict[str, int]]], players: int = 1,
+                      seed: int = 0, run_stages: bool = True) -> MultiWorld:
+    """Creates a multiworld of Pseudoregalia players, running every world stage unless run_stages is False.
+    options is either shared by every player or a list with each player's options, missing options keep their
+    defaults."""
+    if isinstance(options, dict):
+        options = [options] * players
+    multiworld = MultiWorld(players)
+    multiworld.set_seed(seed)
+    world_type = apworld.PseudoregaliaWorld
+    for player, player_options in zip(multiworld.player_ids, options):
+        world = world_type(multiworld, player)
+        world.options = world_type.options_dataclass(**{
+            field.name: field.type(player_options.get(field.name))
+            for field in dataclasses.fields(world_type.options_dataclass)})
+        multiworld.worlds[player] = world
+        multiworld.game[player] = world_type.game
+    if run_stages:
+        for stage in stages:
+            run_stage(multiworld, stage)
+    return multiworld
+
+
+def run_stage(multiworld: MultiWorld, stage: str) -> None:
+    for world in multiworld.worlds.values():
+        getattr(world, stage)()
+
+
+def describe_options(options: Dict[str, int]) -> str:
+    return " ".join(f"{name}={value}" for name, value in options.items())
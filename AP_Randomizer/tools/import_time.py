@@ -0,0 +1,62 @@
+"""Measures how long importing the apworld takes, the way generator startup loads it.
+
+    python AP_Randomizer/tools/import_time.py --runs 30
+
+Every run imports the apworld in a fresh interpreter with -X importtime, so nothing is cached in memory.
+Reports the median total and the median self and cumulative time of each of the apworld's modules.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import harness
+
+snippet = f"""
+import sys, time
+sys.path.insert(0, {harness.tools_dir!r})
+import harness
+start = time.perf_counter()
+harness.load_apworld()
+print(time.perf_counter() - start)
+"""
+
+
+def run_once() -> Tuple[float, Dict[str, List[int]]]:
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", snippet],
+                             capture_output=True, text=True, check=True)
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if name.startswith(harness.package_name):
+            modules[name] = [int(self_time), int(cumulative)]
+    return float(process.stdout.strip().splitlines()[-1]), modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    totals = []
+    modules: Dict[str, List[List[int]]] = {}
+    for _ in range(args.runs):
+        total, run_modules = run_once()
+        totals.append(total)
+        for name, times in run_modules.items():
+            modules.setdefault(name, []).append(times)
+
+    print(f"apworld import: {statistics.median(totals) * 1000:.2f} ms median of {args.runs} runs")
+    print(f"{'self us':>9} {'cumul us':>9}  module")
+    for name, times in sorted(modules.items(), key=lambda entry: -statistics.median(t[1] for t in entry[1])):
+        self_time = statistics.median(t[0] for t in times)
+        cumulative = statistics.median(t[1] for t in times)
+        print(f"{self_time:9.0f} {cumulative:9.0f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
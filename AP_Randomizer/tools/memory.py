@@ -0,0 +1,74 @@
+"""Measures how much memory each Pseudoregalia slot takes in a large multiworld.
+
+    python AP_Randomizer/tools/memory.py --players 200 --json memory.json
+    python AP_Randomizer/tools/memory.py --players 200 --apworld /path/to/other/apworld --baseline memory.json
+
+Generates a multiworld of --players slots cycling through harness.option_matrix once to fill every shared
+cache, then again under tracemalloc, and reports the bytes each world stage leaves allocated per slot.
+Items are measured separately by creating every item of the multiworld again.
+--apworld loads another copy of the apworld, like a checkout of an older commit, to compare against.
+"""
+import argparse
+import json
+import tracemalloc
+from typing import Dict
+
+import harness
+from BaseClasses import MultiWorld
+
+
+def measure(apworld, players: int, seed: int) -> Dict[str, float]:
+    options = [harness.option_matrix[player % len(harness.option_matrix)] for player in range(players)]
+    harness.create_multiworld(apworld, options, players, seed)
+
+    result: Dict[str, float] = {}
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    multiworld: MultiWorld = harness.create_multiworld(apworld, options, players, seed, run_stages=False)
+    for stage in harness.stages:
+        stage_start = tracemalloc.get_traced_memory()[0]
+        harness.run_stage(multiworld, stage)
+        result[f"{stage}_bytes"] = (tracemalloc.get_traced_memory()[0] - stage_start) / players
+    result["total_bytes"] = (tracemalloc.get_traced_memory()[0] - start) / players
+
+    items = [item for item in multiworld.itempool]
+    items += [location.item for location in multiworld.get_filled_locations()]
+    items_start = tracemalloc.get_traced_memory()[0]
+    copies = [multiworld.worlds[item.player].create_item(item.name) for item in items]
+    result["item_bytes"] = (tracemalloc.get_traced_memory()[0] - items_start) / players
+    tracemalloc.stop()
+    del copies
+    result["items"] = len(items) / players
+    result["locations"] = len(multiworld.get_locations()) / players
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=100, help="Pseudoregalia players per multiworld")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--apworld", default=harness.apworld_dir, help="apworld directory to measure")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against results written by --json")
+    args = parser.parse_args()
+
+    result = measure(harness.load_apworld(args.apworld), args.players, args.seed)
+    baseline: Dict[str, float] = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    print(f"{args.players} players, per slot")
+    for name, value in result.items():
+        line = f"{name:>20} {value:12.1f}"
+        if name in baseline:
+            line += f" {value - baseline[name]:+12.1f} {value / baseline[name] - 1:+8.1%}"
+        print(line)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(result, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Records which alternatives of each rule pass during benchmark sweeps, and writes the order that answers the
+recorded calls with the fewest tests to apworld/data/alternative_order.json, see rules.order_requirements.
+
+    python AP_Randomizer/tools/order_alternatives.py --seeds 20
+
+Rules are profiled in the order minimize gives them, across every combination in harness.option_matrix.
+Orders only change which alternative is tested first, never whether a rule passes.
+"""
+import argparse
+import json
+import os
+
+import harness
+from benchmark import sweep
+
+order_file = os.path.join(harness.apworld_dir, "data", "alternative_order.json")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", type=int, default=10, help="sweeps per combination, each in a different order")
+    parser.add_argument("--players", type=int, default=1, help="Pseudoregalia players per multiworld")
+    parser.add_argument("--dry-run", action="store_true", help="report the savings without writing the file")
+    args = parser.parse_args()
+
+    apworld = harness.load_apworld()
+    profiling = apworld.profiling
+    apworld.rules.alternative_orders = {}
+    rule_profile = profiling.rule_profile = profiling.RuleProfile()
+    for options in harness.option_matrix:
+        for seed in range(args.seeds):
+            sweep(harness.create_multiworld(apworld, options, args.players, seed), seed)
+
+    orders = rule_profile.get_alternative_orders()
+    tests_before = tests_after = 0
+    for (name, requirements), stats in rule_profile.stats.items():
+        tests_before += profiling.count_tests(requirements, stats.vectors)
+        order = next((order for order in orders.get(name, ()) if set(order) == set(requirements)), requirements)
+        tests_after += profiling.count_tests(order, stats.vectors)
+    calls = sum(stats.calls for stats in rule_profile.stats.values())
+    print(f"{calls} calls recorded, {tests_before / calls:.3f} tests per call before, "
+          f"{tests_after / calls:.3f} after")
+
+    changed = {name: [order for order in name_orders if order != tuple(sorted(order, key=order_key))]
+               for name, name_orders in sorted(orders.items())}
+    changed = {name: name_orders for name, name_orders in changed.items() if name_orders}
+    print(f"{len(changed)} rules reordered")
+    if not args.dry_run:
+        os.makedirs(os.path.dirname(order_file), exist_ok=True)
+        with open(order_file, "w") as file:
+            lines = [f"  {json.dumps(name)}: {json.dumps(name_orders)}" for name, name_orders in changed.items()]
+            file.write("{\n" + ",\n".join(lines) + "\n}\n")
+
+
+def order_key(capabilities: int):
+    """The order logic.minimize gives alternatives."""
+    return bin(capabilities).count("1"), capabilities
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""Minimal stand-ins for the parts of Archipelago's BaseClasses used by the apworld."""
+from __future__ import annotations
+
+import random
+from collections import Counter, deque
+from enum import IntFlag
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+
+class ItemClassification(IntFlag):
+    filler = 0b0000
+    progression = 0b0001
+    useful = 0b0010
+    trap = 0b0100
+    skip_balancing = 0b1000
+    progression_skip_balancing = 0b1001
+
+
+class Item:
+    game: str = "Generic"
+    __slots__ = ("name", "classification", "code", "player", "location")
+
+    def __init__(self, name: str, classification: ItemClassification, code: Optional[int], player: int):
+        self.name = name
+        self.classification = classification
+        self.code = code
+        self.player = player
+        self.location = None
+
+    @property
+    def advancement(self) -> bool:
+        return ItemClassification.progression in self.classification
+
+    def __repr__(self) -> str:
+        return f"{self.name} (Player {self.player})"
+
+
+class Location:
+    game: str = "Generic"
+    show_in_spoiler: bool = True
+    locked: bool = False
+    access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
+    item_rule: Callable[[Item], bool] = staticmethod(lambda item: True)
+
+    def __init__(self, player: int, name: str = "", address: Optional[int] = None, parent: Optional[Region] = None):
+        self.player = player
+        self.name = name
+        self.address = address
+        self.parent_region = parent
+        self.item: Optional[Item] = None
+
+    def can_fill(self, state: CollectionState, item: Item, check_access: bool = True) -> bool:
+        return self.item_rule(item) and (not check_access or self.can_reach(state))
+
+    def can_reach(self, state: CollectionState) -> bool:
+        return self.parent_region.can_reach(state) and self.access_rule(state)
+
+    def place_locked_item(self, item: Item) -> None:
+        self.item = item
+        item.location = self
+        self.locked = True
+
+    @property
+    def advancement(self) -> bool:
+        return self.item is not None and self.item.advancement
+
+    def __repr__(self) -> str:
+        return f"{self.name} (Player {self.player})"
+
+
+class Entrance:
+    access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
+
+    def __init__(self, player: int, name: str = "", parent: Optional[Region] = None):
+        self.player = player
+        self.name = name
+        self.parent_region = parent
+        self.connected_region: Optional[Region] = None
+
+    def can_reach(self, state: CollectionState) -> bool:
+        return self.parent_region.can_reach(state) and self.access_rule(state)
+
+    def connect(self, region: Region) -> None:
+        self.connected_region = region
+        region.entrances.append(self)
+
+
+class Region:
+    entrance_type = Entrance
+
+    def __init__(self, name: str, player: int, multiworld: MultiWorld):
+        self.name = name
+        self.player = player
+        self.multiworld = multiworld
+        self.locations: List[Location] = []
+        self.exits: List[Entrance] = []
+        self.entrances: List[Entrance] = []
+
+    def can_reach(self, state: CollectionState) -> bool:
+        if state.stale[self.player]:
+            state.update_reachable_regions(self.player)
+        return self in state.reachable_regions[self.player]
+
+    def connect(self, connecting_region: Region, name: Optional[str] = None,
+                rule: Optional[Callable[[CollectionState], bool]] = None) -> Entrance:
+        exit_ = self.entrance_type(self.player, name or f"{self.name} -> {connecting_region.name}", self)
+        if rule:
+            exit_.access_rule = rule
+        exit_.connect(connecting_region)
+        self.exits.append(exit_)
+        self.multiworld.regions.entrance_cache[self.player][exit_.name] = exit_
+        return exit_
+
+    def add_exits(self, exits: Iterable[str], rules: Optional[Dict[str, Callable]] = None) -> List[Entrance]:
+        if not isinstance(exits, dict):
+            exits = dict.fromkeys(exits)
+        return [self.connect(self.multiworld.get_region(name, self.player), entrance_name,
+                             rules[name] if rules and name in rules else None)
+                for name, entrance_name in exits.items()]
+
+    def add_locations(self, locations: Dict[str, Optional[int]], location_type=None) -> None:
+        location_type = location_type or Location
+        for name, address in locations.items():
+            self.locations.append(location_type(self.player, name, address, self))
+
+    def __repr__(self) -> str:
+        return f"{self.name} (Player {self.player})"
+
+
+class RegionManager:
+    def __init__(self, players: int):
+        self.region_cache: Dict[int, Dict[str, Region]] = {p: {} for p in range(1, players + 1)}
+        self.entrance_cache: Dict[int, Dict[str, Entrance]] = {p: {} for p in range(1, players + 1)}
+        self.location_cache: Dict[int, Dict[str, Location]] = {p: {} for p in range(1, players + 1)}
+
+    def append(self, region: Region) -> None:
+        self.region_cache[region.player][region.name] = region
+
+    def extend(self, regions: Iterable[Region]) -> None:
+        for region in regions:
+            self.append(region)
+
+    def __iter__(self):
+        for regions in self.region_cache.values():
+            yield from regions.values()
+
+    def __len__(self) -> int:
+        return sum(len(regions) for regions in self.region_cache.values())
+
+
+class MultiWorld:
+    def __init__(self, players: int):
+        self.players = players
+        self.player_ids = tuple(range(1, players + 1))
+        self.player_name = {player: f"Player{player}" for player in self.player_ids}
+        self.game: Dict[int, str] = {}
+        self.worlds: Dict[int, object] = {}
+        self.regions = RegionManager(players)
+        self.itempool: List[Item] = []
+        self.precollected_items: Dict[int, List[Item]] = {player: [] for player in self.player_ids}
+        self.completion_condition: Dict[int, Callable[[CollectionState], bool]] = {}
+        self.local_early_items: Dict[int, Dict[str, int]] = {player: {} for player in self.player_ids}
+        self.early_items: Dict[int, Dict[str, int]] = {player: {} for player in self.player_ids}
+        self.seed = None
+        self.random = random.Random()
+
+    def get_player_name(self, player: int) -> str:
+        return self.player_name[player]
+
+    def set_seed(self, seed: int) -> None:
+        self.seed = seed
+        self.random.seed(seed)
+
+    def get_region(self, name: str, player: int) -> Region:
+        return self.regions.region_cache[player][name]
+
+    def get_entrance(self, name: str, player: int) -> Entrance:
+        return self.regions.entrance_cache[player][name]
+
+    def get_location(self, name: str, player: int) -> Location:
+        cache = self.regions.location_cache[player]
+        if name not in cache:
+            for region in self.regions.region_cache[player].values():
+                for location in region.locations:
+                    cache[location.name] = location
+        return cache[name]
+
+    def get_locations(self, player: Optional[int] = None) -> List[Location]:
+        players = self.player_ids if player is None else (player,)
+        return [location for p in players
+                for region in self.regions.region_cache[p].values()
+                for location in region.locations]
+
+    def get_filled_locations(self, player: Optional[int] = None) -> List[Location]:
+        return [location for location in self.get_locations(player) if location.item is not None]
+
+    def get_unfilled_locations(self, player: Optional[int] = None) -> List[Location]:
+        return [location for location in self.get_locations(player) if location.item is None]
+
+    def push_precollected(self, item: Item) -> None:
+        self.precollected_items[item.player].append(item)
+
+    def get_all_state(self) -> CollectionState:
+        state = CollectionState(self)
+        for item in self.itempool:
+            state.collect(item, True)
+        for location in self.get_filled_locations():
+            state.collect(location.item, True, location)
+        state.sweep_for_advancements()
+        return state
+
+    def has_beaten_game(self, state: CollectionState, player: Optional[int] = None) -> bool:
+        players = self.player_ids if player is None else (player,)
+        return all(self.completion_condition[p](state) for p in players)
+
+    def can_beat_game(self, starting_state: Optional[CollectionState] = None) -> bool:
+        state = starting_state.copy() if starting_state else CollectionState(self)
+        state.sweep_for_advancements()
+        return self.has_beaten_game(state)
+
+
+class CollectionState:
+    def __init__(self, parent: MultiWorld):
+        self.multiworld = parent
+        self.prog_items: Dict[int, Counter] = {player: Counter() for player in parent.player_ids}
+        self.reachable_regions: Dict[int, Set[Region]] = {player: set() for player in parent.player_ids}
+        self.blocked_connections: Dict[int, Set[Entrance]] = {player: set() for player in parent.player_ids}
+        self.locations_checked: Set[Location] = set()
+        self.stale: Dict[int, bool] = {player: True for player in parent.player_ids}
+        for items in parent.precollected_items.values():
+            for item in items:
+                self.collect(item, True)
+
+    def update_reachable_regions(self, player: int) -> None:
+        self.stale[player] = False
+        reachable = self.reachable_regions[player]
+        blocked = self.blocked_connections[player]
+        queue = deque(blocked)
+        start = self.multiworld.get_region("Menu", player)
+        if start not in reachable:
+            reachable.add(start)
+            blocked.update(start.exits)
+            queue.extend(start.exits)
+        while queue:
+            connection = queue.popleft()
+            new_region = connection.connected_region
+            if new_region in reachable:
+                blocked.discard(connection)
+            elif connection.can_reach(self):
+                reachable.add(new_region)
+                blocked.discard(connection)
+                blocked.update(new_region.exits)
+                queue.extend(new_region.exits)
+
+    def copy(self) -> CollectionState:
+        ret = CollectionState.__new__(CollectionState)
+        ret.multiworld = self.multiworld
+        ret.prog_items = {player: counter.copy() for player, counter in self.prog_items.items()}
+        ret.reachable_regions = {player: set(regions) for player, regions in self.reachable_regions.items()}
+        ret.blocked_connections = {player: set(entrances) for player, entrances in self.blocked_connections.items()}
+        ret.locations_checked = set(self.locations_checked)
+        ret.stale = dict(self.stale)
+        return ret
+
+    def can_reach_region(self, name: str, player: int) -> bool:
+        return self.multiworld.get_region(name, player).can_reach(self)
+
+    def sweep_for_advancements(self, locations: Optional[Iterable[Location]] = None) -> None:
+        if locations is None:
+            locations = self.multiworld.get_filled_locations()
+        reachable = True
+        while reachable:
+            reachable = [location for location in locations
+                         if location not in self.locations_checked and location.advancement
+                         and location.can_reach(self)]
+            for location in reachable:
+                self.collect(location.item, True, location)
+
+    def has(self, item: str, player: int, count: int = 1) -> bool:
+        return self.prog_items[player][item] >= count
+
+    def has_all(self, items: Iterable[str], player: int) -> bool:
+        return all(self.prog_items[player][item] for item in items)
+
+    def has_any(self, items: Iterable[str], player: int) -> bool:
+        return any(self.prog_items[player][item] for item in items)
+
+    def count(self, item: str, player: int) -> int:
+        return self.prog_items[player][item]
+
+    def collect(self, item: Item, prevent_sweep: bool = False, location: Optional[Location] = None) -> bool:
+        if location:
+            self.locations_checked.add(location)
+        changed = self.multiworld.worlds[item.player].collect(self, item)
+        self.stale[item.player] = True
+        if changed and not prevent_sweep:
+            self.sweep_for_advancements()
+        return changed
+
+    def remove(self, item: Item) -> None:
+        changed = self.multiworld.worlds[item.player].remove(self, item)
+        if changed:
+            self.reachable_regions[item.player] = set()
+            self.blocked_connections[item.player] = set()
+            self.stale[item.player] = True
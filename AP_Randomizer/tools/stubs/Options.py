@@ -0,0 +1,51 @@
+"""Minimal stand-ins for the option classes used by the apworld."""
+from dataclasses import dataclass
+
+
+class Option:
+    default = 0
+    display_name = ""
+
+    def __init__(self, value=None):
+        self.value = self.default if value is None else int(value)
+
+    def __eq__(self, other):
+        if isinstance(other, Option):
+            return self.value == other.value
+        return self.value == other
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __int__(self):
+        return self.value
+
+    def __index__(self):
+        return self.value
+
+    def __bool__(self):
+        return bool(self.value)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.value})"
+
+
+class Toggle(Option):
+    default = 0
+
+
+class DefaultOnToggle(Toggle):
+    default = 1
+
+
+class Choice(Option):
+    pass
+
+
+class DeathLink(Toggle):
+    display_name = "Death Link"
+
+
+@dataclass
+class PerGameCommonOptions:
+    pass
@@ -0,0 +1,7 @@
+"""Minimal stand-in for the parts of Archipelago's Utils used by the apworld."""
+import os
+import tempfile
+
+
+def cache_path(*path: str) -> str:
+    return os.path.join(os.environ.get("AP_CACHE_DIR", os.path.join(tempfile.gettempdir(), "ap_cache")), *path)
@@ -0,0 +1,53 @@
+"""Minimal stand-in for Archipelago's World base class."""
+import random
+from typing import Any, Dict
+
+
+class World:
+    game: str = "Generic"
+    options_dataclass = None
+
+    def __init__(self, multiworld, player: int):
+        self.multiworld = multiworld
+        self.player = player
+        self.random = random.Random(multiworld.random.getrandbits(64))
+
+    def collect_item(self, state, item, remove: bool = False):
+        return item.name if item.advancement else None
+
+    def collect(self, state, item) -> bool:
+        name = self.collect_item(state, item)
+        if name:
+            state.prog_items[self.player][name] += 1
+            return True
+        return False
+
+    def remove(self, state, item) -> bool:
+        name = self.collect_item(state, item, True)
+        if name:
+            state.prog_items[self.player][name] -= 1
+            if state.prog_items[self.player][name] < 1:
+                del state.prog_items[self.player][name]
+            return True
+        return False
+
+    def generate_early(self) -> None:
+        pass
+
+    def create_regions(self) -> None:
+        pass
+
+    def create_items(self) -> None:
+        pass
+
+    def set_rules(self) -> None:
+        pass
+
+    def generate_basic(self) -> None:
+        pass
+
+    def pre_fill(self) -> None:
+        pass
+
+    def fill_slot_data(self) -> Dict[str, Any]:
+        return {}
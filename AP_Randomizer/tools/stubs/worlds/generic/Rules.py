@@ -0,0 +1,20 @@
+"""Minimal stand-ins for Archipelago's rule helpers."""
+from typing import Callable, Union
+
+from BaseClasses import CollectionState, Entrance, Location
+
+CollectionRule = Callable[[CollectionState], bool]
+
+
+def set_rule(spot: Union[Location, Entrance], rule: CollectionRule) -> None:
+    spot.access_rule = rule
+
+
+def add_rule(spot: Union[Location, Entrance], rule: CollectionRule, combine: str = "and") -> None:
+    old_rule = spot.access_rule
+    if old_rule is Location.access_rule or old_rule is Entrance.access_rule:
+        spot.access_rule = rule if combine == "and" else old_rule
+    elif combine == "and":
+        spot.access_rule = lambda state: rule(state) and old_rule(state)
+    else:
+        spot.access_rule = lambda state: rule(state) or old_rule(state)